@@ -0,0 +1,107 @@
+import functools
+import os
+import pickle
+
+from _regex import DOCSTRING_RE
+
+# Number of characters read when looking for the leading docstring.
+HEADER_SIZE = 8192
+
+# On-disk cache shared by generate_examples_docs.py and generate_nav.py so a
+# docs build that runs both scripts only parses each example once.
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".docstring_cache.pkl")
+
+def _load_disk_cache():
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+# Maps file path -> (st_mtime_ns, st_size, (title, description, doc_end)).
+_disk_cache = _load_disk_cache()
+_disk_cache_dirty = False
+
+def extract_docstring(content):
+    """
+    Extract the initial triple-quoted docstring from already-read file content.
+    Returns a tuple (title, description, docstring_end_index) where:
+      - title: the page title (either from a "Title:" prefix or the first line)
+      - description: the remaining lines of the docstring
+      - docstring_end_index: the index in the content where the docstring ends
+    """
+    # Look for a triple-quoted docstring at the very beginning.
+    match = DOCSTRING_RE.search(content)
+    if match:
+        docstring = match.group(1).strip()
+        lines = docstring.splitlines()
+        title = ""
+        description = ""
+        if lines:
+            # If the first line starts with "Title:", use that.
+            if lines[0].startswith("Title:"):
+                title = lines[0][len("Title:"):].strip()
+                description = "\n".join(lines[1:]).strip()
+            else:
+                # Fallback: use the first line as title.
+                title = lines[0].strip()
+                description = "\n".join(lines[1:]).strip()
+        return title, description, match.end()
+    return None, None, None
+
+def _read_docstring(file_path):
+    """
+    Reads only the header of the file and extracts its docstring, falling
+    back to the full file if the header ended mid-docstring.
+    """
+    with open(file_path, 'r', encoding='utf-8', buffering=HEADER_SIZE) as f:
+        content = f.read(HEADER_SIZE)
+        result = extract_docstring(content)
+        if result[0] is None and len(content) == HEADER_SIZE:
+            result = extract_docstring(content + f.read())
+    return result
+
+@functools.lru_cache(maxsize=None)
+def _cached_docstring(file_path, mtime_ns, size):
+    global _disk_cache_dirty
+    cached = _disk_cache.get(file_path)
+    if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+        return cached[2]
+    result = _read_docstring(file_path)
+    _disk_cache[file_path] = (mtime_ns, size, result)
+    _disk_cache_dirty = True
+    return result
+
+def extract_docstring_from_path(file_path):
+    """
+    Cached, header-only version of extract_docstring for callers that don't
+    need the rest of the file. Entries are keyed on the file's
+    modification time and size, so edited examples are parsed again.
+    """
+    st = os.stat(file_path)
+    return _cached_docstring(file_path, st.st_mtime_ns, st.st_size)
+
+def store_docstring(file_path, mtime_ns, size, result):
+    """
+    Records a docstring parsed by a caller that already read the whole file,
+    so generate_nav.py can reuse it without opening the file again.
+    """
+    global _disk_cache_dirty
+    entry = (mtime_ns, size, result)
+    if _disk_cache.get(file_path) != entry:
+        _disk_cache[file_path] = entry
+        _disk_cache_dirty = True
+
+def save_cache():
+    """
+    Writes the docstring cache to disk if anything new was parsed.
+    """
+    global _disk_cache_dirty
+    if not _disk_cache_dirty:
+        return
+    tmp_path = CACHE_PATH + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(_disk_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, CACHE_PATH)
+    _disk_cache_dirty = False
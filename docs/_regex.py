@@ -0,0 +1,7 @@
+import re
+
+# Patterns shared by the docs generation scripts. Compiled once at import
+# time so the per-file and per-line loops don't go through re's internal cache.
+
+# Triple-quoted docstring at the very beginning of a file.
+DOCSTRING_RE = re.compile(r'^\s*"""(.*?)"""', re.DOTALL)
@@ -1,32 +1,7 @@
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor
 
-def extract_docstring(file_path):
-    """
-    Extract the initial triple-quoted docstring from the file.
-    Returns a tuple (title, description, docstring_end_index) where:
-      - title: the page title (either from a "Title:" prefix or the first line)
-      - description: the remaining lines of the docstring
-      - docstring_end_index: the index in the file content where the docstring ends
-    """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    # Look for a triple-quoted docstring at the very beginning.
-    match = re.search(r'^\s*"""(.*?)"""', content, re.DOTALL)
-    if match:
-        docstring = match.group(1).strip()
-        lines = docstring.splitlines()
-        title = ""
-        description = ""
-        if lines:
-            if lines[0].startswith("Title:"):
-                title = lines[0][len("Title:"):].strip()
-                description = "\n".join(lines[1:]).strip()
-            else:
-                title = lines[0].strip()
-                description = "\n".join(lines[1:]).strip()
-        return title, description, match.end()
-    return None, None, None
+from _docstring_cache import extract_docstring, save_cache, store_docstring
 
 def is_separator_line(line):
     """
@@ -38,11 +13,13 @@ def is_separator_line(line):
     if not stripped.startswith("#"):
         return False
     content = stripped[1:].strip()  # Remove '#' and extra whitespace.
-    return bool(re.fullmatch(r'[-_]{3,}', content))
+    # Counting in C is cheaper than running the regex engine on every comment line.
+    n = len(content)
+    return n >= 3 and content.count("-") + content.count("_") == n
 
-def split_into_blocks(text):
+def split_into_blocks(lines):
     """
-    Splits the given text (the code after the docstring) into alternating blocks.
+    Splits the given lines (the code after the docstring) into alternating blocks.
     Each block is a tuple (block_type, content) where block_type is either 'comment' or 'code'.
     
     The function:
@@ -51,43 +28,43 @@ def split_into_blocks(text):
       - Groups consecutive non-comment (code) lines together.
       - Treats blank lines as part of the current block.
     """
-    lines = text.splitlines()
-    blocks = []
+    # Blocks are tracked as (block_type, start, stop) line ranges and only
+    # joined into strings once at the end.
+    spans = []
     current_type = None
-    current_lines = []
-
-    def flush_block():
-        nonlocal current_lines, current_type, blocks
-        if current_lines:
-            blocks.append((current_type, "\n".join(current_lines).rstrip("\n")))
-            current_lines = []
-
-    for line in lines:
-        if is_separator_line(line):
-            # A separator line signals a new block; flush current block and skip the separator.
-            flush_block()
-            continue
+    start = 0
 
+    for i, line in enumerate(lines):
         # Determine if the current line is a comment or code.
         stripped = line.lstrip()
         if stripped.startswith("#"):
+            if is_separator_line(stripped):
+                # A separator line signals a new block; close the current one and skip the separator.
+                if start < i:
+                    spans.append((current_type, start, i))
+                start = i + 1
+                continue
             line_type = "comment"
+        elif stripped == "":
+            # If the line is blank and we haven't started a block, default to code.
+            line_type = current_type if current_type is not None else "code"
         else:
             line_type = "code"
 
-        # If the line is blank and we haven't started a block, default to code.
-        if stripped == "":
-            line_type = current_type if current_type is not None else "code"
-
-        # If the type changes, flush the current block.
+        # If the type changes, close the current block.
         if current_type is None:
             current_type = line_type
         elif line_type != current_type:
-            flush_block()
+            if start < i:
+                spans.append((current_type, start, i))
+            start = i
             current_type = line_type
-        current_lines.append(line)
-    flush_block()
-    return blocks
+    if start < len(lines):
+        spans.append((current_type, start, len(lines)))
+    return [
+        (block_type, "\n".join(lines[begin:end]).rstrip("\n"))
+        for block_type, begin, end in spans
+    ]
 
 def process_comment_block(block):
     """
@@ -96,10 +73,13 @@ def process_comment_block(block):
     """
     processed_lines = []
     for line in block.splitlines():
-        if line.lstrip().startswith("#"):
+        stripped = line.lstrip()
+        if stripped.startswith("#"):
             # Remove the first '#' and one following space if present.
-            processed_line = re.sub(r'^\s*#\s?', '', line)
-            processed_lines.append(processed_line)
+            body = stripped[1:]
+            if body[:1].isspace():
+                body = body[1:]
+            processed_lines.append(body)
         else:
             processed_lines.append(line)
     return "\n".join(processed_lines).strip()
@@ -110,57 +90,98 @@ def generate_markdown(file_path, output_path):
       - Uses the initial docstring for the page header (title and description).
       - Splits the remaining content into alternating comment and code blocks.
       - Renders comment blocks as plain Markdown text and code blocks as fenced code blocks.
+    Returns (st_mtime_ns, st_size, docstring) for the file, so the caller can
+    update the docstring cache without reading the file again.
     """
     with open(file_path, 'r', encoding='utf-8') as f:
+        st = os.fstat(f.fileno())
         content = f.read()
     
-    title, description, doc_end = extract_docstring(file_path)
+    docstring = extract_docstring(content)
+    cache_entry = (st.st_mtime_ns, st.st_size, docstring)
+    title, description, doc_end = docstring
     if not title:
         print(f"Skipped {file_path}: no docstring found")
-        return
+        return cache_entry
 
-    # Remove the initial docstring from the content.
-    remaining_content = content[doc_end:].lstrip("\n")
+    # Remove the initial docstring and split the remaining lines into blocks.
+    blocks = split_into_blocks(content[doc_end:].lstrip("\n").splitlines())
     
-    # Split the remaining content into blocks.
-    blocks = split_into_blocks(remaining_content)
-    
-    # Build the Markdown output.
-    md_parts = []
-    md_parts.append(f"# {title}\n")
+    # Build the Markdown output. Every part after the first carries its own
+    # leading blank-line separator so the parts can be concatenated as-is.
+    md_parts = [f"# {title}\n"]
     if description:
-        md_parts.append(f"{description}\n")
+        md_parts.append(f"\n{description}\n")
     
     for block_type, block_content in blocks:
         if block_type == "comment":
             processed = process_comment_block(block_content)
             if processed:
-                md_parts.append(processed + "\n")
+                md_parts.append(f"\n{processed}\n")
         elif block_type == "code":
             if block_content.strip():
-                md_parts.append("```python\n" + block_content + "\n```\n")
+                md_parts.append(f"\n```python\n{block_content}\n```\n")
     
-    md_content = "\n".join(md_parts)
+    md_content = "".join(md_parts)
+    # Leave unchanged pages alone so their mtime stays stable for incremental builds.
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            if f.read() == md_content:
+                print(f"Unchanged {output_path}")
+                return cache_entry
+    except (OSError, UnicodeDecodeError):
+        pass
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
+    # Write to a temporary file first so readers never see a half-written page.
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         f.write(md_content)
+    os.replace(tmp_path, output_path)
     print(f"Generated {output_path}")
+    return cache_entry
+
+def iter_python_files(dir_path, rel_prefix=""):
+    """
+    Recursively yields (file_path, rel_path) for all .py files below dir_path,
+    where rel_path is relative to the top-level directory.
+    Uses os.scandir so the file/directory checks come from the cached
+    directory entry instead of an extra stat call per entry. Paths are built
+    by concatenating a prefix that already ends in a separator.
+    """
+    top = os.path.join(dir_path, "")
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_python_files(top + name, rel_prefix + name + os.sep)
+            elif entry.is_file(follow_symlinks=False) and name.endswith('.py'):
+                yield top + name, rel_prefix + name
 
 def main():
     examples_dir = "examples"         # Folder with your Python example files.
     docs_dir = "docs/examples"         # Output folder for the generated Markdown files.
     
-    # Walk through the examples directory.
-    for root, _, files in os.walk(examples_dir):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = os.path.join(root, file)
-                # Compute the file path relative to the examples directory.
-                rel_path = os.path.relpath(file_path, examples_dir)
-                # Change the extension to .md.
-                md_rel_path = os.path.splitext(rel_path)[0] + ".md"
-                output_md_path = os.path.join(docs_dir, md_rel_path)
-                generate_markdown(file_path, output_md_path)
+    out_prefix = os.path.join(docs_dir, "")
+    # Walk through the examples directory and collect the work up front.
+    file_paths = []
+    output_md_paths = []
+    for file_path, rel_path in iter_python_files(examples_dir):
+        file_paths.append(file_path)
+        # Change the extension to .md.
+        output_md_paths.append(out_prefix + rel_path[:-len('.py')] + ".md")
+    if not file_paths:
+        return
+
+    # Every file is independent, so render them in parallel. Each worker
+    # reads its file once and hands back the parsed docstring.
+    max_workers = min(os.cpu_count() or 1, len(file_paths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so exceptions raised in a worker are not swallowed.
+        results = executor.map(generate_markdown, file_paths, output_md_paths)
+        for file_path, (mtime_ns, size, docstring) in zip(file_paths, results):
+            # Warm the docstring cache so generate_nav.py can reuse it.
+            store_docstring(file_path, mtime_ns, size, docstring)
+    save_cache()
 
 if __name__ == "__main__":
     main()
@@ -1,82 +1,115 @@
 #!/usr/bin/env python3
 import os
-import re
 import yaml  # pip install pyyaml if needed
 
-def extract_docstring(file_path):
-    """
-    Extracts the initial triple-quoted docstring from the file.
-    Returns a tuple: (title, description) or (None, None) if not found.
-    """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    # Look for a triple-quoted docstring at the very beginning.
-    match = re.search(r'^\s*"""(.*?)"""', content, re.DOTALL)
-    if match:
-        docstring = match.group(1).strip()
-        # Split the docstring by lines.
-        lines = docstring.splitlines()
-        title = ""
-        description = ""
-        if lines:
-            # If the first line starts with "Title:", use that.
-            if lines[0].startswith("Title:"):
-                title = lines[0][len("Title:"):].strip()
-                description = "\n".join(lines[1:]).strip()
-            else:
-                # Fallback: use the first line as title.
-                title = lines[0].strip()
-                description = "\n".join(lines[1:]).strip()
-        return title, description
-    return None, None
+# Prefer the LibYAML bindings; fall back to the pure-Python implementation.
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+from _docstring_cache import extract_docstring_from_path, save_cache
 
 def build_nav_items(dir_path, base_dir):
     """
-    Recursively builds a list of nav items based on the folder structure.
+    Recursively yields nav items based on the folder structure.
     Each Python file is read to extract its docstring title and then converted
     to a nav entry pointing to the corresponding markdown file (with .md extension).
     """
-    nav_items = []
-    
-    # List the directory entries and sort them for predictable order.
-    entries = sorted(os.listdir(dir_path))
-    # Optionally, skip directories that you don't want in the nav.
-    entries = [entry for entry in entries if entry not in ['__pycache__']]
+    # Scan the directory once, sort the entries for predictable order and
+    # split them into subdirectories and .py files in the same pass.
+    # DirEntry caches the file type, so no extra stat is needed per entry.
+    with os.scandir(dir_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    sub_dirs = []
+    py_files = []
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            # Skip hidden and dunder directories such as __pycache__.
+            if not name.startswith(('.', '__')):
+                sub_dirs.append(entry)
+        elif name.endswith('.py') and entry.is_file(follow_symlinks=False):
+            py_files.append(entry)
     
     # Process subdirectories first.
-    for entry in entries:
-        full_path = os.path.join(dir_path, entry)
-        if os.path.isdir(full_path):
-            # Recursively build nav items for subdirectories.
-            sub_nav = build_nav_items(full_path, base_dir)
-            if sub_nav:
-                # Use the directory name as the group title.
-                nav_items.append({ entry: sub_nav })
+    for entry in sub_dirs:
+        # Recursively build nav items for subdirectories.
+        sub_nav = list(build_nav_items(entry.path, base_dir))
+        if sub_nav:
+            # Use the directory name as the group title.
+            yield { entry.name: sub_nav }
     
     # Process .py files.
-    for entry in entries:
-        full_path = os.path.join(dir_path, entry)
-        if os.path.isfile(full_path) and entry.endswith('.py'):
-            title, _ = extract_docstring(full_path)
-            if not title or title == None or title == "":
-                print(f"Skipped because no matching docstring found! {full_path}")
-                continue
-            # Compute the markdown file path (preserve relative structure, change .py to .md).
-            rel_path = os.path.relpath(full_path, base_dir)
-            md_path = os.path.splitext(rel_path)[0] + ".md"
-            # Ensure the path uses forward slashes.
-            nav_items.append({ title: md_path.replace(os.sep, "/") })
+    for entry in py_files:
+        full_path = entry.path
+        title, _, _ = extract_docstring_from_path(full_path)
+        if not title:
+            print(f"Skipped because no matching docstring found! {full_path}")
+            continue
+        # Compute the markdown file path (preserve relative structure, change .py to .md).
+        rel_path = os.path.relpath(full_path, base_dir)
+        md_path = os.path.splitext(rel_path)[0] + ".md"
+        # Ensure the path uses forward slashes.
+        yield { title: md_path.replace(os.sep, "/") }
+
+def _indent_of(line):
+    return len(line) - len(line.lstrip(' '))
+
+def splice_examples_nav(lines, nav_items):
+    """
+    Replaces (or appends) the "examples" item of the top-level nav list in the
+    given mkdocs.yml lines with a freshly rendered fragment for nav_items.
+    Only the examples subtree is dumped; all other lines are kept as-is.
+    Returns the new list of lines, or None if the nav section doesn't have
+    the expected block layout.
+    """
+    # Locate the top-level "nav:" key.
+    nav_start = next((i for i, line in enumerate(lines) if line.rstrip() == "nav:"), None)
+    if nav_start is None:
+        return None
+    
+    # The nav block runs until the next top-level key.
+    nav_end = nav_start + 1
+    while nav_end < len(lines) and (not lines[nav_end].strip() or lines[nav_end][0] in ' -#'):
+        nav_end += 1
+    while nav_end > nav_start + 1 and not lines[nav_end - 1].strip():
+        nav_end -= 1
     
-    return nav_items
+    # All nav items share the indentation of the first one.
+    items = [i for i in range(nav_start + 1, nav_end) if lines[i].strip() and not lines[i].lstrip().startswith('#')]
+    if not items or not lines[items[0]].lstrip().startswith('- '):
+        return None
+    item_indent = _indent_of(lines[items[0]])
+    indent = ' ' * item_indent
+    
+    # Render only the examples subtree and indent it to the nav item level.
+    fragment = yaml.dump([{'examples': nav_items}], Dumper=SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    fragment_lines = [indent + line for line in fragment.splitlines(keepends=True)]
+    
+    # Search for an "examples" node in the nav list and replace its whole subtree.
+    for i in items:
+        if _indent_of(lines[i]) == item_indent and lines[i].lstrip().startswith('- examples:'):
+            end = i + 1
+            while end < nav_end and (not lines[end].strip() or _indent_of(lines[end]) > item_indent):
+                end += 1
+            while end > i + 1 and not lines[end - 1].strip():
+                end -= 1
+            return lines[:i] + fragment_lines + lines[end:]
+    
+    # If no "examples" node was found, append one.
+    if not lines[nav_end - 1].endswith('\n'):
+        lines = lines[:nav_end - 1] + [lines[nav_end - 1] + '\n'] + lines[nav_end:]
+    return lines[:nav_end] + fragment_lines + lines[nav_end:]
 
-def update_mkdocs_nav(nav_items, mkdocs_path='mkdocs.yml'):
+def rewrite_mkdocs_nav(nav_items, mkdocs_path='mkdocs.yml'):
     """
     Loads the existing mkdocs.yaml file, updates (or adds) the top-level "examples"
-    node in the nav section with the new nav_items, and writes it back.
+    node in the nav section with the new nav_items, and writes the whole file back.
     """
     # Load the current mkdocs.yaml content.
     with open(mkdocs_path, 'r', encoding='utf-8') as f:
-        mkdocs_config = yaml.safe_load(f)
+        mkdocs_config = yaml.load(f, Loader=SafeLoader)
     if mkdocs_config is None:
         mkdocs_config = {}
     
@@ -103,7 +136,24 @@ def update_mkdocs_nav(nav_items, mkdocs_path='mkdocs.yml'):
     
     # Write the updated configuration back to mkdocs.yaml.
     with open(mkdocs_path, 'w', encoding='utf-8') as f:
-        yaml.dump(mkdocs_config, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
+        yaml.dump(mkdocs_config, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
+
+def update_mkdocs_nav(nav_items, mkdocs_path='mkdocs.yml'):
+    """
+    Updates (or adds) the top-level "examples" node in the nav section of
+    mkdocs.yaml. Only the examples fragment is re-rendered and spliced into the
+    file, leaving the rest of it untouched; if the nav section can't be located,
+    the whole file is loaded and dumped again instead.
+    """
+    with open(mkdocs_path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines(keepends=True)
+    
+    new_lines = splice_examples_nav(lines, nav_items)
+    if new_lines is None:
+        rewrite_mkdocs_nav(nav_items, mkdocs_path)
+    else:
+        with open(mkdocs_path, 'w', encoding='utf-8') as f:
+            f.writelines(new_lines)
     
     print(f"mkdocs.yaml updated with the new examples navigation.")
 
@@ -114,7 +164,8 @@ def main():
         return
     
     # Build the navigation items from the examples folder.
-    nav_items = build_nav_items(base_dir, ".")
+    nav_items = list(build_nav_items(base_dir, "."))
+    save_cache()
     # Update the mkdocs.yaml file.
     update_mkdocs_nav(nav_items)
 
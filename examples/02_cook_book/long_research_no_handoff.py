@@ -13,12 +13,15 @@ This example implements https://dspy.ai/#__tabbed_2_6 to also highlight the abil
 
 import asyncio
 
+from flock.core.context.context import FlockContext
 from flock.core.flock import Flock
 from flock.core.flock_agent import FlockAgent
 from flock.core.logging.formatters.base_formatter import FormatterOptions
 from flock.core.logging.formatters.rich_formatters import RichTables
 from flock.core.tools import basic_tools
 
+MAX_PARALLEL_DRAFTS = 8
+
 
 async def main():
 
@@ -49,20 +52,28 @@ async def main():
         start_agent=outline_agent,
     )
 
-    sections =[]
-    # We then do our processing (in this case formatting the content) and run the draft agent for each section
-    for heading, subheadings in result.section_subheadings.items():
-            section, subheadings = f"## {heading}", [f"### {subheading}" for subheading in subheadings]
+    # We then do our processing (in this case formatting the content) and run the draft agent for each section.
+    # The sections don't depend on each other, so we draft them concurrently, capped to stay within provider rate limits.
+    # Each draft gets its own context so concurrent runs don't mix their state and history.
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_DRAFTS)
+
+    async def draft_section(heading, subheadings):
+        async with semaphore:
             result_content = await flock.run_async(
                 input={"topic": result.topic,
-                       "section_heading": section,
-                       "section_subheadings": subheadings
+                       "section_heading": f"## {heading}",
+                       "section_subheadings": [f"### {subheading}" for subheading in subheadings]
                        },
                 start_agent=draft_agent,
+                context=FlockContext(),
             )
-            sections.append(result_content.content)
-            with open("output.md", "w") as f:
-                f.write("\n\n".join(sections))
+            return result_content.content
+
+    sections = await asyncio.gather(
+        *[draft_section(heading, subheadings) for heading, subheadings in result.section_subheadings.items()]
+    )
+    with open("output.md", "w") as f:
+        f.write("\n\n".join(sections))
 
 
 
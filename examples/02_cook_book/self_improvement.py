@@ -8,6 +8,7 @@ import warnings
 from flock.core.tools import basic_tools
 warnings.simplefilter("error", UserWarning)
 import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 
 from flock.core.flock import Flock
@@ -18,9 +19,13 @@ from rich.panel import Panel
 from rich.console import Console
 
 
+# Only the most recent turns are sent with each query. Older knowledge lives on in memory.txt.
+MAX_CHAT_HISTORY = 20
+
+
 @dataclass
 class Chat:
-    chat_history: list[str] = field(default_factory=list)
+    chat_history: deque = field(default_factory=lambda: deque(maxlen=MAX_CHAT_HISTORY))
     user_query: str = ""
     answer_to_query: str = ""
     memory: str = ""
@@ -37,7 +42,7 @@ class Chat:
         # Use a Rich-styled prompt to get user input
         self.user_query = Prompt.ask("[bold cyan]User[/bold cyan]")
         inputs["user_query"] = self.user_query
-        inputs["chat_history"] = self.chat_history
+        inputs["chat_history"] = list(self.chat_history)
         inputs["memory"] = self.memory
 
     # Triggers after the agent responds to the user query
@@ -46,11 +51,12 @@ class Chat:
         console = Console()
         self.answer_to_query = outputs["answer_to_query"]
         self.chat_history.append({"user": self.user_query, "assistant": self.answer_to_query})
-        self.memory += outputs.get("important_new_knowledge_to_add_to_memory", "") + "\n"
+        new_knowledge = outputs.get("important_new_knowledge_to_add_to_memory", "") + "\n"
+        self.memory += new_knowledge
 
-        # Save updated memory to file
-        with open("memory.txt", "w") as file:
-            file.write(self.memory)
+        # Append only the new knowledge to the memory file instead of rewriting all of it
+        with open("memory.txt", "a") as file:
+            file.write(new_knowledge)
 
         # Display the assistant's reasoning (if available) in a styled panel
         reasoning = outputs.get("reasoning", "")
@@ -1,4 +1,6 @@
 # flock/config.py
+import functools
+
 from decouple import config
 
 from flock.core.logging.telemetry import TelemetryConfig
@@ -13,9 +15,12 @@ TAVILY_API_KEY = config("TAVILY_API_KEY", "")
 GITHUB_PAT = config("GITHUB_PAT", "")
 GITHUB_REPO = config("GITHUB_REPO", "")
 GITHUB_USERNAME = config("GITHUB_USERNAME", "")
+# Client-side limits for the GitHub tools (requests per second, in flight)
+GITHUB_RPS = config("FLOCK_GH_RPS", 3, cast=float)
+GITHUB_CONCURRENCY = config("FLOCK_GH_CONCURRENCY", 4, cast=int)
 
 # -- Debugging and Logging Configurations --
-LOCAL_DEBUG = config("LOCAL_DEBUG", True)
+LOCAL_DEBUG = config("LOCAL_DEBUG", True, cast=bool)
 LOG_LEVEL = config("LOG_LEVEL", "DEBUG")
 LOGGING_DIR = config("LOGGING_DIR", "logs")
 
@@ -28,9 +33,11 @@ JAEGER_TRANSPORT = config(
 ).lower()  # Options: "grpc" or "http"
 OTEL_SQL_DATABASE_NAME = config("OTEL_SQL_DATABASE", "flock_events.db")
 OTEL_FILE_NAME = config("OTEL_FILE_NAME", "flock_events.jsonl")
-OTEL_ENABLE_SQL: bool = config("OTEL_ENABLE_SQL", True) == "True"
-OTEL_ENABLE_FILE: bool = config("OTEL_ENABLE_FILE", True) == "True"
-OTEL_ENABLE_JAEGER: bool = config("OTEL_ENABLE_JAEGER", False) == "True"
+OTEL_ENABLE_SQL: bool = config("OTEL_ENABLE_SQL", False, cast=bool)
+OTEL_ENABLE_FILE: bool = config("OTEL_ENABLE_FILE", False, cast=bool)
+OTEL_ENABLE_JAEGER: bool = config("OTEL_ENABLE_JAEGER", False, cast=bool)
+# Standard OpenTelemetry variable; when set, spans are exported via OTLP.
+OTEL_EXPORTER_OTLP_ENDPOINT = config("OTEL_EXPORTER_OTLP_ENDPOINT", "")
 
 
 TELEMETRY = TelemetryConfig(
@@ -43,5 +50,19 @@ TELEMETRY = TelemetryConfig(
     OTEL_ENABLE_JAEGER,
     OTEL_ENABLE_FILE,
     OTEL_ENABLE_SQL,
+    otlp_endpoint=OTEL_EXPORTER_OTLP_ENDPOINT or None,
 )
-TELEMETRY.setup_tracing()
+
+
+@functools.cache
+def setup_tracing() -> None:
+    """Set up OpenTelemetry tracing once, on first use rather than at import."""
+    TELEMETRY.setup_tracing()
+
+
+def tracing_requested(enable_logging: bool) -> bool:
+    """Return True if a run should set up tracing.
+
+    That is the case when logging is enabled or an OTLP endpoint is set.
+    """
+    return enable_logging or bool(OTEL_EXPORTER_OTLP_ENDPOINT)
@@ -0,0 +1,82 @@
+"""In-process cache for FlockAgent evaluation results."""
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
+
+def _reject(obj: Any) -> Any:
+    raise TypeError(f"Cannot build a cache key from {type(obj).__name__}")
+
+
+class ResultCache:
+    """Bounded LRU cache mapping an agent call to the result it produced.
+
+    Keys cover everything that determines an agent's output: its name, model,
+    description, input/output signature, agent type and tools, plus the
+    resolved inputs, minus the agent's `cache_exclude_keys`. Calls whose
+    remaining inputs are not plain JSON data (e.g. a whole FlockContext) are
+    never cached, since they have no stable key.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """Create an empty cache holding at most `max_size` results."""
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(agent: Any, inputs: dict[str, Any]) -> str | None:
+        """Return the cache key for running `agent` on `inputs`, or None if uncacheable."""
+        exclude = getattr(agent, "cache_exclude_keys", None)
+        if exclude:
+            inputs = {k: v for k, v in inputs.items() if k not in exclude}
+        tools = [
+            getattr(tool, "__qualname__", type(tool).__name__)
+            for tool in agent.tools or []
+        ]
+        try:
+            payload = json.dumps(
+                [
+                    agent.name,
+                    agent.model,
+                    str(agent.description),
+                    str(agent.input),
+                    str(agent.output),
+                    agent.config.agent_type_override,
+                    tools,
+                    inputs,
+                ],
+                sort_keys=True,
+                default=_reject,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a deep copy of the cached result for `key`, if any."""
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a deep copy of `result` under `key`, evicting the oldest entry if full."""
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+
+result_cache = ResultCache()
@@ -0,0 +1,117 @@
+"""Request-scoped deduplication of tool calls across concurrent agent runs."""
+
+import functools
+import inspect
+import json
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# Attribute set by `read_only_tool` on tools that are safe to deduplicate.
+_READ_ONLY_ATTR = "__flock_read_only__"
+
+
+class _ToolCallBatch:
+    """Pending and finished tool calls of one `tool_call_scope`."""
+
+    __slots__ = ("calls", "lock")
+
+    def __init__(self) -> None:
+        """Create an empty batch."""
+        self.lock = threading.Lock()
+        self.calls: dict[tuple, Future] = {}
+
+
+# Tool calls made within the current batch, keyed by tool and arguments.
+# None outside of a batch, in which case tools run uncached.
+_tool_calls: ContextVar[_ToolCallBatch | None] = ContextVar(
+    "flock_tool_calls", default=None
+)
+
+
+def _reject(obj: Any) -> Any:
+    raise TypeError(f"Cannot build a cache key from {type(obj).__name__}")
+
+
+def read_only_tool(tool: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark `tool` as free of side effects so identical calls may be shared.
+
+    Only tools carrying this mark are deduplicated by `dedupe_tool_calls`.
+    Do not use it on tools that write files, create remote resources or
+    otherwise change state, since a shared call runs only once per batch.
+
+    Args:
+        tool: The tool callable to mark.
+
+    Returns:
+        The same callable.
+    """
+    setattr(tool, _READ_ONLY_ATTR, True)
+    return tool
+
+
+@contextmanager
+def tool_call_scope() -> Iterator[None]:
+    """Share tool results between all calls made inside this block.
+
+    Agent runs started inside the block (including tasks and threads that
+    inherit its context) reuse the result of an identical earlier or
+    in-flight call to a `read_only_tool` instead of calling the tool again.
+    Results are dropped when the block exits.
+    """
+    token = _tool_calls.set(_ToolCallBatch())
+    try:
+        yield
+    finally:
+        _tool_calls.reset(token)
+
+
+def dedupe_tool_calls(tool: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap `tool` so identical calls inside a `tool_call_scope` run once.
+
+    Tools that are not marked with `read_only_tool` and coroutine functions
+    are returned unchanged. Outside of a scope, and for calls whose
+    arguments are not plain JSON data, the wrapper simply calls the tool.
+    Concurrent identical calls wait for the first one to finish and share
+    its result or exception.
+
+    Args:
+        tool: The tool callable to wrap.
+
+    Returns:
+        A callable with the same name, docstring and signature as `tool`.
+    """
+    if inspect.iscoroutinefunction(tool) or not getattr(
+        tool, _READ_ONLY_ATTR, False
+    ):
+        return tool
+
+    @functools.wraps(tool)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        batch = _tool_calls.get()
+        if batch is None:
+            return tool(*args, **kwargs)
+        try:
+            arguments = json.dumps(
+                [args, kwargs], sort_keys=True, default=_reject
+            )
+        except (TypeError, ValueError):
+            return tool(*args, **kwargs)
+        key = (tool, arguments)
+        with batch.lock:
+            call = batch.calls.get(key)
+            owner = call is None
+            if owner:
+                call = batch.calls[key] = Future()
+        if owner:
+            try:
+                call.set_result(tool(*args, **kwargs))
+            except BaseException as e:
+                call.set_exception(e)
+                raise
+        return call.result()
+
+    return wrapper
@@ -1,5 +1,8 @@
-from dataclasses import asdict, dataclass, field
+import copy
+import functools
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
+from itertools import islice
 from typing import Any, Literal
 
 from opentelemetry import trace
@@ -12,7 +15,81 @@ logger = get_logger("context")
 tracer = trace.get_tracer(__name__)
 
 
-@dataclass
+def _tracing_enabled() -> bool:
+    # Tracing may be set up after this module is imported (see
+    # flock.config.setup_tracing), so the global provider is checked per call.
+    return not isinstance(
+        trace.get_tracer_provider(), trace.ProxyTracerProvider
+    )
+
+
+_SPAN_VALUE_LIMIT = 256
+
+
+def _span_value(value: Any) -> str:
+    # Span attributes only need a hint of the value: scalars are shown
+    # truncated, containers and objects by type, so a large result is never
+    # stringified just to be attached to a span.
+    if isinstance(value, str | int | float | bool) or value is None:
+        return str(value)[:_SPAN_VALUE_LIMIT]
+    return type(value).__name__
+
+
+@functools.lru_cache(maxsize=256)
+def _split_input_keys(input_spec: str) -> tuple[str, ...]:
+    return tuple(k.strip() for k in input_spec.split(",") if k.strip())
+
+
+_IMMUTABLE_TYPES = frozenset(
+    {str, int, float, bool, bytes, type(None), datetime}
+)
+
+
+def _fast_copy(obj: Any) -> Any:
+    # Deep copy for the plain data that lives in a context. Anything else
+    # falls back to copy.deepcopy.
+    cls = type(obj)
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+    if cls is dict:
+        return {k: _fast_copy(v) for k, v in obj.items()}
+    if cls is list:
+        return [_fast_copy(v) for v in obj]
+    if cls is tuple:
+        return tuple(_fast_copy(v) for v in obj)
+    return copy.deepcopy(obj)
+
+
+def _to_plain(obj: Any) -> Any:
+    # Same output as dataclasses.asdict with datetime fields turned into ISO
+    # strings, but leaf values are taken over instead of deep-copied.
+    cls = type(obj)
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+    if cls is dict:
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if cls is list:
+        return [_to_plain(v) for v in obj]
+    if is_dataclass(obj) and not isinstance(obj, type):
+        result = {}
+        for f in fields(obj):
+            value = getattr(obj, f.name)
+            result[f.name] = (
+                value.isoformat()
+                if isinstance(value, datetime)
+                else _to_plain(value)
+            )
+        return result
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return cls(*[_to_plain(v) for v in obj])
+    if isinstance(obj, list | tuple):
+        return cls(_to_plain(v) for v in obj)
+    if isinstance(obj, dict):
+        return cls((_to_plain(k), _to_plain(v)) for k, v in obj.items())
+    return obj
+
+
+@dataclass(slots=True)
 class AgentRunRecord:
     agent: str = field(default="")
     data: dict[str, Any] = field(default_factory=dict)
@@ -21,7 +98,7 @@ class AgentRunRecord:
     called_from: str = field(default="")
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDefinition:
     agent_type: str = field(default="")
     agent_name: str = field(default="")
@@ -40,6 +117,45 @@ class FlockContext(Serializable):
     workflow_id: str = field(default="")
     workflow_timestamp: str = field(default="")
 
+    def __post_init__(self) -> None:
+        """Set up the lookup indexes over `history`.
+
+        The indexes are kept out of the dataclass fields so they are never
+        serialized, and records are indexed lazily on lookup. `history` is
+        treated as append-only: the index is rebuilt when the list is
+        replaced, shrinks or its last indexed record is swapped out, but
+        earlier records must not be replaced in place.
+        """
+        self._reset_history_index()
+
+    def _reset_history_index(self) -> None:
+        self._indexed_history = self.history
+        self._indexed_count = 0
+        self._last_indexed: AgentRunRecord | None = None
+        self._records_by_agent: dict[str, list[AgentRunRecord]] = {}
+        # Latest record per data key; values are read from the record itself,
+        # so results stored with copy_data=False and changed later stay current.
+        self._latest_records: dict[str, AgentRunRecord] = {}
+
+    def _sync_history_index(self) -> None:
+        history = self.history
+        count = self._indexed_count
+        if (
+            self._indexed_history is not history
+            or count > len(history)
+            or (count and history[count - 1] is not self._last_indexed)
+        ):
+            self._reset_history_index()
+            count = 0
+        latest_records = self._latest_records
+        for record in islice(history, count, None):
+            self._records_by_agent.setdefault(record.agent, []).append(record)
+            for key in record.data:
+                latest_records[key] = record
+        if history:
+            self._last_indexed = history[-1]
+        self._indexed_count = len(history)
+
     def record(
         self,
         agent_name: str,
@@ -47,38 +163,55 @@ class FlockContext(Serializable):
         timestamp: str,
         hand_off: str,
         called_from: str,
+        copy_data: bool = True,
     ) -> None:
+        # Callers that hand over a result they never touch again can pass
+        # copy_data=False to store it without the defensive copy.
         record = AgentRunRecord(
             agent=agent_name,
-            data=data.copy(),
+            data=data.copy() if copy_data else data,
             timestamp=timestamp,
             hand_off=hand_off,
             called_from=called_from,
         )
         self.history.append(record)
+        # Write the per-key variables straight into state: the whole result is
+        # logged and traced once below instead of once per key.
+        state = self.state
+        prefix = agent_name + "."
         for key, value in data.items():
-            self.set_variable(f"{agent_name}.{key}", value)
-        self.set_variable(FLOCK_LAST_RESULT, data)
-        self.set_variable(FLOCK_LAST_AGENT, agent_name)
-        logger.info(
-            "Agent run recorded",
-            agent=agent_name,
-            timestamp=timestamp,
-            data=data,
-        )
-        current_span = trace.get_current_span()
-        if current_span.get_span_context().is_valid:
-            current_span.add_event(
-                "record",
-                attributes={"agent": agent_name, "timestamp": timestamp},
+            state[prefix + key] = value
+        state[FLOCK_LAST_RESULT] = data
+        state[FLOCK_LAST_AGENT] = agent_name
+        if logger.enable_logging:
+            logger.info(
+                "Agent run recorded",
+                agent=agent_name,
+                timestamp=timestamp,
+                keys=list(data),
             )
+        if _tracing_enabled():
+            current_span = trace.get_current_span()
+            if current_span.get_span_context().is_valid:
+                current_span.add_event(
+                    "record",
+                    attributes={"agent": agent_name, "timestamp": timestamp},
+                )
 
     def get_variable(self, key: str) -> Any:
         return self.state.get(key)
 
     def set_variable(self, key: str, value: Any) -> None:
-        old_value = self.state.get(key)
-        self.state[key] = value
+        state = self.state
+        old_value = state.get(key)
+        state[key] = value
+        if old_value is value:
+            return
+        # The comparison below can be an arbitrarily deep __eq__, so only pay
+        # for it when someone is going to see the change.
+        tracing = _tracing_enabled()
+        if not (logger.enable_logging or tracing):
+            return
         if old_value != value:
             logger.info(
                 "Context variable updated",
@@ -86,33 +219,59 @@ class FlockContext(Serializable):
                 old=old_value,
                 new=value,
             )
-            current_span = trace.get_current_span()
-            if current_span.get_span_context().is_valid:
+            current_span = trace.get_current_span() if tracing else None
+            if current_span and current_span.get_span_context().is_valid:
                 current_span.add_event(
                     "set_variable",
                     attributes={
                         "key": key,
-                        "old": str(old_value),
-                        "new": str(value),
+                        "old": _span_value(old_value),
+                        "new": _span_value(value),
                     },
                 )
 
     def deepcopy(self) -> "FlockContext":
-        return FlockContext.from_dict(self.to_dict())
+        return FlockContext(
+            state=_fast_copy(self.state),
+            history=[
+                AgentRunRecord(
+                    agent=record.agent,
+                    data=_fast_copy(record.data),
+                    timestamp=record.timestamp,
+                    hand_off=_fast_copy(record.hand_off),
+                    called_from=record.called_from,
+                )
+                for record in self.history
+            ],
+            agent_definitions={
+                name: AgentDefinition(
+                    agent_type=definition.agent_type,
+                    agent_name=definition.agent_name,
+                    agent_data=_fast_copy(definition.agent_data),
+                    serializer=definition.serializer,
+                )
+                for name, definition in self.agent_definitions.items()
+            },
+            run_id=self.run_id,
+            workflow_id=self.workflow_id,
+            workflow_timestamp=self.workflow_timestamp,
+        )
 
     def get_agent_history(self, agent_name: str) -> list[AgentRunRecord]:
-        return [record for record in self.history if record.agent == agent_name]
+        self._sync_history_index()
+        return list(self._records_by_agent.get(agent_name, ()))
 
     def next_input_for(self, agent) -> Any:
         try:
             if hasattr(agent, "input") and isinstance(agent.input, str):
-                keys = [k.strip() for k in agent.input.split(",") if k.strip()]
+                keys = _split_input_keys(agent.input)
+                get = self.state.get
                 if len(keys) == 1:
-                    return self.get_variable(keys[0])
+                    return get(keys[0])
                 else:
-                    return {key: self.get_variable(key) for key in keys}
+                    return {key: get(key) for key in keys}
             else:
-                return self.get_variable("init_input")
+                return self.state.get("init_input")
         except Exception as e:
             logger.error(
                 "Error getting next input for agent",
@@ -122,9 +281,17 @@ class FlockContext(Serializable):
             raise
 
     def get_most_recent_value(self, variable_name: str) -> Any:
+        self._sync_history_index()
+        record = self._latest_records.get(variable_name)
+        if record is None:
+            return None
+        if variable_name in record.data:
+            return record.data[variable_name]
+        # The key was removed from the record after it was indexed.
         for history_record in reversed(self.history):
             if variable_name in history_record.data:
                 return history_record.data[variable_name]
+        return None
 
     def get_agent_definition(self, agent_name: str) -> AgentDefinition | None:
         return self.agent_definitions.get(agent_name)
@@ -141,42 +308,35 @@ class FlockContext(Serializable):
 
     # Use the reactive setter for dict-like access.
     def __getitem__(self, key: str) -> Any:
-        return self.get_variable(key)
+        return self.state.get(key)
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.set_variable(key, value)
 
     def to_dict(self) -> dict[str, Any]:
-        def convert(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if hasattr(obj, "__dataclass_fields__"):
-                return asdict(
-                    obj, dict_factory=lambda x: {k: convert(v) for k, v in x}
-                )
-            return obj
-
-        return convert(asdict(self))
+        return _to_plain(self)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "FlockContext":
-        def convert(obj):
-            if isinstance(obj, dict):
-                if "timestamp" in obj:
-                    return AgentRunRecord(
-                        **{
-                            **obj,
-                            "timestamp": datetime.fromisoformat(
-                                obj["timestamp"]
-                            ),
-                        }
-                    )
-                if "agent_type" in obj:
-                    return AgentDefinition(**obj)
-                return {k: convert(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [convert(v) for v in obj]
-            return obj
-
-        converted = convert(data)
-        return cls(**converted)
+        # Only history and agent_definitions hold dataclasses; state values are
+        # plain data and are taken over as they are.
+        history = []
+        for record in data.get("history", ()):
+            timestamp = record.get("timestamp")
+            if isinstance(timestamp, str) and timestamp:
+                record = {
+                    **record,
+                    "timestamp": datetime.fromisoformat(timestamp),
+                }
+            history.append(AgentRunRecord(**record))
+        agent_definitions = {
+            name: AgentDefinition(**definition)
+            for name, definition in data.get("agent_definitions", {}).items()
+        }
+        return cls(
+            **{
+                **data,
+                "history": history,
+                "agent_definitions": agent_definitions,
+            }
+        )
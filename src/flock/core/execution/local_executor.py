@@ -1,4 +1,6 @@
 # src/your_package/core/execution/local_executor.py
+from box import Box
+
 from flock.core.context.context import FlockContext
 from flock.core.logging.logging import get_logger
 from flock.workflow.activities import run_agent  # This should be the local activity function
@@ -20,8 +22,6 @@ async def run_local_workflow(context: FlockContext, output_formatter, box_result
     logger.info("Running local debug workflow")
     result = await run_agent(context, output_formatter)
     if box_result:
-        from box import Box
-
         logger.debug("Boxing result")
         return Box(result)
     return result
@@ -1,4 +1,5 @@
 # src/your_package/core/execution/temporal_executor.py
+from box import Box
 from devtools import pprint
 
 from flock.core.context.context import FlockContext
@@ -34,9 +35,11 @@ async def run_temporal_workflow(
     flock_client = await create_temporal_client()
     workflow_id = context.get_variable(FLOCK_RUN_ID)
     logger.info("Executing Temporal workflow", workflow_id=workflow_id)
+    # Hand the dataclass to the data converter as-is: the orjson converter
+    # encodes it natively instead of going through to_dict() first.
     result = await flock_client.execute_workflow(
         FlockWorkflow.run,
-        context.to_dict(),
+        context,
         id=workflow_id,
         task_queue="flock-queue",
     )
@@ -49,8 +52,6 @@ async def run_temporal_workflow(
     else:
         pprint(result)
     if box_result:
-        from box import Box
-
         logger.debug("Boxing Temporal result")
         return Box(result)
     return result
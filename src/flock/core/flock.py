@@ -64,6 +64,7 @@ class Flock:
                 enable_logging=enable_logging,
             )
             logger.enable_logging = enable_logging
+            self.enable_logging = enable_logging
             session_id = get_baggage("session_id")
             if not session_id:
                 session_id = str(uuid.uuid4())
@@ -89,8 +90,8 @@ class Flock:
     def add_agent(self, agent: T) -> T:
         """Add a new agent to the Flock system.
 
-        This method registers the agent, updates the internal registry and global context, and
-        sets default values if needed. If an agent with the same name already exists, the existing
+        This method registers the agent, updates the internal registry, and sets default values
+        if needed. The agent's definition is added to the context when a run starts. If an agent with the same name already exists, the existing
         agent is returned.
 
         Args:
@@ -108,18 +109,16 @@ class Flock:
                     model=self.model,
                 )
 
-            if agent.name in self.agents:
+            existing = self.agents.get(agent.name)
+            if existing is not None:
                 logger.warning(
                     f"Agent {agent.name} already exists, returning existing instance"
                 )
-                return self.agents[agent.name]
+                return existing
             logger.info("Adding new agent")
 
             self.agents[agent.name] = agent
             self.registry.register_agent(agent)
-            self.context.add_agent_definition(
-                type(agent), agent.name, agent.to_dict()
-            )
 
             if hasattr(agent, "tools") and agent.tools:
                 for tool in agent.tools:
@@ -128,6 +127,19 @@ class Flock:
             logger.success("Agent added successfully")
             return agent
 
+    def _add_agent_definitions(self) -> None:
+        """Add the definitions of agents not yet known to the run's context.
+
+        Serializing an agent pickles its callables, so this is done once per
+        agent and context when a run starts instead of in add_agent.
+        """
+        definitions = self.context.agent_definitions
+        for name, agent in self.agents.items():
+            if name not in definitions:
+                self.context.add_agent_definition(
+                    type(agent), name, agent.to_dict()
+                )
+
     def add_tool(self, tool_name: str, tool: callable):
         """Register a tool with the Flock system.
 
@@ -145,7 +157,7 @@ class Flock:
     async def run_async(
         self,
         start_agent: FlockAgent | str,
-        input: dict = {},
+        input: dict | None = None,
         context: FlockContext = None,
         run_id: str = "",
         box_result: bool = True,
@@ -161,7 +173,7 @@ class Flock:
 
         Args:
             start_agent (FlockAgent | str): The agent instance or the name of the agent to start the workflow.
-            input (dict): A dictionary of input values required by the agent.
+            input (dict, optional): A dictionary of input values required by the agent. It is copied, never modified.
             context (FlockContext, optional): A FlockContext instance to use. If not provided, a default context is used.
             run_id (str, optional): A unique identifier for this run. If empty, one is generated automatically.
             box_result (bool, optional): If True, wraps the output in a Box for nicer formatting. Defaults to True.
@@ -173,6 +185,12 @@ class Flock:
             ValueError: If the specified agent is not found in the registry.
             Exception: For any other errors encountered during execution.
         """
+        # Imported here: flock.config imports flock.core, which imports us.
+        from flock.config import setup_tracing, tracing_requested
+
+        if tracing_requested(self.enable_logging):
+            setup_tracing()
+
         with tracer.start_as_current_span("run_async") as span:
             span.set_attribute(
                 "start_agent",
@@ -191,12 +209,13 @@ class Flock:
                     logger.debug(
                         "Looking up agent by name", agent_name=start_agent
                     )
-                    start_agent = self.registry.get_agent(start_agent)
-                    if not start_agent:
+                    agent = self.registry.get_agent(start_agent)
+                    if agent is None:
                         logger.error("Agent not found", agent_name=start_agent)
                         raise ValueError(
                             f"Agent '{start_agent}' not found in registry"
                         )
+                    start_agent = agent
                     start_agent.resolve_callables(context=self.context)
                 if context:
                     logger.debug("Using provided context")
@@ -207,18 +226,28 @@ class Flock:
 
                 set_baggage("run_id", run_id)
 
+                # Work on a copy so neither the caller's dict nor a previous
+                # run's prompted values leak into this run.
+                input = dict(input) if input else {}
                 # TODO - Add a check for required input keys
-                input_keys = top_level_to_keys(start_agent.input)
-                for key in input_keys:
-                    if key.startswith("flock."):
-                        key = key[6:]  # Remove the "flock." prefix
-                    if key not in input:
-                        from rich.prompt import Prompt
+                missing_keys = [
+                    key
+                    for key in (
+                        key.removeprefix("flock.")
+                        for key in top_level_to_keys(start_agent.input)
+                    )
+                    if key not in input
+                ]
+                if missing_keys:
+                    from rich.prompt import Prompt
 
+                    for key in missing_keys:
                         input[key] = Prompt.ask(
                             f"Please enter {key} for {start_agent.name}"
                         )
 
+                self._add_agent_definitions()
+
                 # Initialize the context with standardized variables
                 initialize_context(
                     self.context,
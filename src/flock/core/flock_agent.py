@@ -1,17 +1,25 @@
 """FlockAgent is the core, declarative base class for all agents in the Flock framework."""
 
+import asyncio
+import re
 from abc import ABC
 from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from typing import Any, Literal, Union
 
 import cloudpickle
 from pydantic import BaseModel, Field
 
+from flock.core.cache.result_cache import result_cache
+from flock.core.cache.tool_cache import tool_call_scope
 from flock.core.context.context import FlockContext
+from flock.core.logging import span_payload
 from flock.core.logging.logging import get_logger
+from flock.core.logging.span_payload import set_payload_attribute
 from flock.core.mixin.dspy_integration import AgentType, DSPyIntegrationMixin
 from flock.core.mixin.prompt_parser import PromptParserMixin
+from flock.workflow.temporal_setup import get_client, run_activity
 
 logger = get_logger("flock")
 
@@ -20,8 +28,12 @@ from opentelemetry import trace
 
 tracer = trace.get_tracer(__name__)
 
+# Hex-encoded pickles start with the PROTO opcode (0x80), and even the
+# smallest pickled callable is longer than this minimum.
+_PICKLE_HEX = re.compile(r"80[0-9a-f]{30,}")
 
-@dataclass
+
+@dataclass(slots=True)
 class FlockAgentConfig:
     """Configuration options for a FlockAgent."""
 
@@ -43,7 +55,7 @@ class FlockAgentConfig:
     data_type: Literal["json", "cloudpickle", "msgpack"] = "cloudpickle"
 
 
-@dataclass
+@dataclass(slots=True)
 class HandOff:
     """Base class for handoff returns."""
 
@@ -163,6 +175,22 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
         description="Set to True to enable caching of the agent's results.",
     )
 
+    cache_results: bool = Field(
+        default=False,
+        description=(
+            "Set to True to reuse in-process results of earlier evaluations with identical inputs "
+            "instead of running the agent again."
+        ),
+    )
+
+    cache_exclude_keys: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Input keys left out of the result cache key, e.g. volatile context or tool "
+            "output that should not prevent an otherwise identical call from being cached."
+        ),
+    )
+
     hand_off: str | Callable[..., Any] | None = Field(
         None,
         description=(
@@ -293,25 +321,37 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
                 - Return a dictionary similar to:
                     {"idea": "A fun app idea based on ...", "query": "build an app", "context": {"previous_idea": "messaging app"}}
         """
-        with tracer.start_as_current_span("agent.evaluate") as span:
+        with self._evaluate_span() as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
+            cache_key = (
+                result_cache.make_key(self, inputs)
+                if self.cache_results
+                else None
+            )
+            if cache_key is not None:
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    span.set_attribute("cache_hit", True)
+                    logger.info("Cache hit", agent=self.name)
+                    return cached
             try:
-                # Create and configure the signature and language model.
-                self.__dspy_signature = self.create_dspy_signature_class(
-                    self.name,
-                    self.description,
-                    f"{self.input} -> {self.output}",
-                )
-                self._configure_language_model()
+                # Get the signature and configure the language model.
+                signature = self._get_dspy_signature()
+                lm = self._configure_language_model()
                 agent_task = self._select_task(
-                    self.__dspy_signature,
+                    signature,
                     agent_type_override=self.config.agent_type_override,
                 )
-                # Execute the task.
-                result = agent_task(**inputs)
+                # Execute the task. dspy calls block on the LLM request, so
+                # they run in a worker thread to keep the event loop free.
+                result = await asyncio.to_thread(
+                    self._run_task, agent_task, inputs, lm
+                )
                 result = self._process_result(result, inputs)
-                span.set_attribute("result", str(result))
+                if cache_key is not None and isinstance(result, dict):
+                    result_cache.put(cache_key, result)
+                set_payload_attribute(span, "result", result)
                 logger.info("Evaluation successful", agent=self.name)
                 return result
             except Exception as eval_error:
@@ -323,6 +363,19 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
                 span.record_exception(eval_error)
                 raise
 
+    def _evaluate_span(self) -> AbstractContextManager[trace.Span]:
+        """Return the span context for `evaluate`.
+
+        By default evaluation is recorded on the current span (normally the enclosing `agent.run`
+        span), with an event marking its start. With FLOCK_DETAILED_TRACES enabled it gets its own
+        `agent.evaluate` child span.
+        """
+        if span_payload.DETAILED_TRACES:
+            return tracer.start_as_current_span("agent.evaluate")
+        span = trace.get_current_span()
+        span.add_event("agent.evaluate")
+        return nullcontext(span)
+
     async def run(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Run the agent with the given inputs and return its generated output.
 
@@ -371,12 +424,12 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
         """
         with tracer.start_as_current_span("agent.run") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
             try:
                 await self.initialize(inputs)
                 result = await self.evaluate(inputs)
                 await self.terminate(inputs, result)
-                span.set_attribute("result", str(result))
+                set_payload_attribute(span, "result", result)
                 logger.info("Agent run completed", agent=self.name)
                 return result
             except Exception as run_error:
@@ -387,6 +440,40 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
                 span.record_exception(run_error)
                 raise
 
+    async def run_many(
+        self, inputs_list: list[dict[str, Any]], max_concurrency: int = 32
+    ) -> list[dict[str, Any]]:
+        """Run this agent on several independent inputs concurrently.
+
+        Each input goes through the full `run()` lifecycle. At most `max_concurrency` runs are in
+        flight at once, so a large batch does not open an unbounded number of LLM requests. All
+        runs share the agent's dspy signature, task and language model, and identical tool calls
+        made by different runs of the batch are executed only once.
+
+        **Arguments:**
+            inputs_list (list[dict[str, Any]]): The inputs for each run, as passed to `run()`.
+            max_concurrency (int): The maximum number of runs executing at the same time.
+
+        **Returns:**
+            list[dict[str, Any]]: The result of each run, in the order of `inputs_list`. If any run
+            fails, its exception is raised once the other runs have been awaited.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(inputs: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.run(inputs)
+
+        with tool_call_scope():
+            results = await asyncio.gather(
+                *(run_one(inputs) for inputs in inputs_list),
+                return_exceptions=True,
+            )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
     async def run_temporal(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Execute this agent via a Temporal workflow for enhanced fault tolerance and asynchronous processing.
 
@@ -430,18 +517,14 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
         """
         with tracer.start_as_current_span("agent.run_temporal") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
             try:
-                from temporalio.client import Client
-
+                # Imported here: agent_activities imports this module.
                 from flock.workflow.agent_activities import (
                     run_flock_agent_activity,
                 )
-                from flock.workflow.temporal_setup import run_activity
 
-                client = await Client.connect(
-                    "localhost:7233", namespace="default"
-                )
+                client = await get_client()
                 agent_data = self.to_dict()
                 inputs_data = inputs
 
@@ -451,7 +534,7 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
                     run_flock_agent_activity,
                     {"agent_data": agent_data, "inputs": inputs_data},
                 )
-                span.set_attribute("result", str(result))
+                set_payload_attribute(span, "result", result)
                 logger.info("Temporal run successful", agent=self.name)
                 return result
             except Exception as temporal_error:
@@ -470,11 +553,11 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
         the agent's fields and replaces any callable objects (such as lifecycle hooks or tools) with their corresponding
         resolved values from the context. This ensures that the agent is fully configured and ready
         """
-        if isinstance(self.input, Callable):
+        if callable(self.input):
             self.input = self.input(context)
-        if isinstance(self.output, Callable):
+        if callable(self.output):
             self.output = self.output(context)
-        if isinstance(self.description, Callable):
+        if callable(self.description):
             self.description = self.description(context)
 
     def to_dict(self) -> dict[str, Any]:
@@ -561,7 +644,13 @@ class FlockAgent(BaseModel, ABC, PromptParserMixin, DSPyIntegrationMixin):
         """
 
         def convert_callable(obj: Any) -> Any:
-            if isinstance(obj, str) and len(obj) > 2:
+            # Only strings shaped like a hex-encoded pickle are decoded; any
+            # other string is plain data and never reaches the try block.
+            if (
+                isinstance(obj, str)
+                and len(obj) % 2 == 0
+                and _PICKLE_HEX.fullmatch(obj)
+            ):
                 try:
                     return cloudpickle.loads(bytes.fromhex(obj))
                 except Exception:
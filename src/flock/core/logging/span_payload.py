@@ -0,0 +1,50 @@
+"""Settings and helpers for how much agent detail goes onto OpenTelemetry spans."""
+
+import reprlib
+from typing import Any
+
+from decouple import config
+from opentelemetry.trace import Span
+
+# Set FLOCK_TRACE_PAYLOADS=false to keep inputs and results out of spans.
+TRACE_PAYLOADS: bool = config("FLOCK_TRACE_PAYLOADS", True, cast=bool)
+# Set FLOCK_DETAILED_TRACES=true to give each agent evaluation its own span
+# instead of annotating the enclosing agent.run span.
+DETAILED_TRACES: bool = config("FLOCK_DETAILED_TRACES", False, cast=bool)
+MAX_PAYLOAD_LENGTH = 2048
+
+_payload_repr = reprlib.Repr()
+_payload_repr.maxlevel = 4
+_payload_repr.maxdict = 32
+_payload_repr.maxlist = 32
+_payload_repr.maxtuple = 32
+_payload_repr.maxset = 32
+_payload_repr.maxstring = 512
+_payload_repr.maxother = 512
+
+
+def should_record_payload(span: Span) -> bool:
+    """Return True if payloads should be formatted and attached to `span`."""
+    return TRACE_PAYLOADS and span.is_recording()
+
+
+def format_payload(value: Any) -> str:
+    """Return a bounded, abbreviated representation of `value` for a span."""
+    return _payload_repr.repr(value)[:MAX_PAYLOAD_LENGTH]
+
+
+def set_payload_attribute(span: Span, key: str, value: Any) -> None:
+    """Attach a bounded representation of `value` to `span` under `key`.
+
+    Nothing is formatted unless payload tracing is enabled and the span is
+    actually recording, so untraced runs never stringify large inputs or
+    results. Nested containers and long strings are abbreviated while being
+    formatted, so the cost does not grow with the size of the payload.
+
+    Args:
+        span: The span to annotate.
+        key: The attribute name.
+        value: The payload to record.
+    """
+    if should_record_payload(span):
+        span.set_attribute(key, format_payload(value))
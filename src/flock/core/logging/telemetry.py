@@ -5,7 +5,10 @@ import sys
 from opentelemetry import trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SimpleSpanProcessor,
+)
 from temporalio import workflow
 
 from flock.core.logging.span_middleware.baggage_span_processor import (
@@ -27,6 +30,7 @@ class TelemetryConfig:
       - Export spans to a Jaeger collector using gRPC.
       - Write spans to a file.
       - Save spans in a SQLite database.
+      - Export spans to an OTLP collector.
 
     Only exporters with a non-None configuration will be activated.
     """
@@ -43,6 +47,7 @@ class TelemetryConfig:
         enable_file: bool = True,
         enable_sql: bool = True,
         batch_processor_options: dict | None = None,
+        otlp_endpoint: str | None = None,
     ):
         """:param service_name: Name of your service.
 
@@ -50,6 +55,7 @@ class TelemetryConfig:
         :param file_export_path: If provided, spans will be written to this file.
         :param sqlite_db_path: If provided, spans will be stored in this SQLite DB.
         :param batch_processor_options: Dict of options for BatchSpanProcessor (e.g., {"max_export_batch_size": 10}).
+        :param otlp_endpoint: If provided, spans will be exported to this OTLP gRPC endpoint.
         """
         self.service_name = service_name
         self.jaeger_endpoint = jaeger_endpoint
@@ -61,6 +67,7 @@ class TelemetryConfig:
         self.enable_jaeger = enable_jaeger
         self.enable_file = enable_file
         self.enable_sql = enable_sql
+        self.otlp_endpoint = otlp_endpoint
         self.global_tracer = None
 
     def setup_tracing(self):
@@ -111,6 +118,19 @@ class TelemetryConfig:
             )
             span_processors.append(SimpleSpanProcessor(sqlite_exporter))
 
+        # If an OTLP endpoint is configured, batch spans to the collector.
+        if self.otlp_endpoint:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
+
+            otlp_exporter = OTLPSpanExporter(endpoint=self.otlp_endpoint)
+            span_processors.append(
+                BatchSpanProcessor(
+                    otlp_exporter, **self.batch_processor_options
+                )
+            )
+
         # Register all span processors with the provider.
         for processor in span_processors:
             provider.add_span_processor(processor)
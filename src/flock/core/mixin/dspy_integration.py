@@ -4,6 +4,10 @@ import inspect
 import sys
 from typing import Any, Literal
 
+from decouple import config
+
+from flock.core.cache.lru import LRUCache
+from flock.core.cache.tool_cache import dedupe_tool_calls
 from flock.core.logging.logging import get_logger
 from flock.core.util.input_resolver import get_callable_members, split_top_level
 
@@ -13,6 +17,15 @@ AgentType = (
     Literal["ReAct"] | Literal["Completion"] | Literal["ChainOfThought"] | None
 )
 
+# Upper bound for each of the caches below (FLOCK_DSPY_CACHE_SIZE).
+DSPY_CACHE_SIZE: int = config("FLOCK_DSPY_CACHE_SIZE", 256, cast=int)
+# Signature classes already built, keyed by agent class and signature spec.
+_signature_classes = LRUCache(DSPY_CACHE_SIZE)
+# Task modules already built, keyed by signature, agent type and tools.
+_tasks = LRUCache(DSPY_CACHE_SIZE)
+# Language models already created, keyed by model name and cache setting.
+_language_models = LRUCache(DSPY_CACHE_SIZE)
+
 
 class DSPyIntegrationMixin:
     """Mixin class for integrating with the dspy library."""
@@ -143,28 +156,99 @@ class DSPyIntegrationMixin:
 
         return type("dspy_" + agent_name, (base_class,), class_dict)
 
-    def _configure_language_model(self) -> None:
+    def _get_dspy_signature(self) -> Any:
+        """Return the dspy signature for the agent's current name, description and I/O spec.
+
+        Building a signature evaluates every field type, so the class is built
+        once per spec and reused by every later evaluation.
+        """
+        fields_spec = f"{self.input} -> {self.output}"
+        key = (type(self), self.name, self.description, fields_spec)
+        signature = _signature_classes.get(key)
+        if signature is None:
+            signature = self.create_dspy_signature_class(
+                self.name, self.description, fields_spec
+            )
+            _signature_classes[key] = signature
+        return signature
+
+    def _configure_language_model(self) -> Any:
+        """Configure dspy with the language model for this agent's model.
+
+        One language model is created per model name and cache setting and
+        shared by all agents using it.
+
+        Returns:
+            The configured dspy language model.
+        """
         import dspy
 
-        """Initialize and configure the language model using dspy."""
-        lm = dspy.LM(self.model, cache=self.use_cache)
+        key = (self.model, self.use_cache)
+        lm = _language_models.get(key)
+        if lm is None:
+            lm = _language_models[key] = dspy.LM(
+                self.model, cache=self.use_cache
+            )
         dspy.configure(lm=lm)
+        return lm
+
+    def _run_task(
+        self, agent_task: Any, inputs: dict[str, Any], lm: Any
+    ) -> Any:
+        """Call the dspy task with the given language model.
+
+        The model is bound with dspy.context, so the call can run in a worker
+        thread while other agents configure different models.
+
+        Args:
+            agent_task: The dspy task to call.
+            inputs: The keyword arguments for the task.
+            lm: The language model to use, or None for the configured one.
+
+        Returns:
+            The raw result of the task.
+        """
+        if lm is None:
+            return agent_task(**inputs)
+        import dspy
+
+        with dspy.context(lm=lm):
+            return agent_task(**inputs)
 
     def _select_task(
         self,
         signature: Any,
         agent_type_override: AgentType,
     ) -> Any:
-        """Select and instantiate the appropriate task based on tool availability.
+        """Select the appropriate task based on tool availability.
+
+        Tasks are built once per signature, agent type and tool list and
+        reused by later calls.
 
         Args:
-            prompt: The detailed prompt string.
-            input_desc: Dictionary of input key descriptions.
-            output_desc: Dictionary of output key descriptions.
+            signature: The dspy signature class for the task.
+            agent_type_override: Forces a specific task type if set.
 
         Returns:
             An instance of a dspy task (either ReAct or Predict).
         """
+        key = (signature, agent_type_override, tuple(self.tools or ()))
+        try:
+            task = _tasks.get(key)
+        except TypeError:
+            # Unhashable tools, build a fresh task every time.
+            return self._build_task(signature, agent_type_override)
+        if task is None:
+            task = self._build_task(signature, agent_type_override)
+            _tasks[key] = task
+        return task
+
+    def _build_task(
+        self,
+        signature: Any,
+        agent_type_override: AgentType,
+    ) -> Any:
+        """Instantiate the dspy task for the signature and the agent's tools."""
         import dspy
 
         processed_tools = []
@@ -174,6 +258,9 @@ class DSPyIntegrationMixin:
                     processed_tools.extend(get_callable_members(tool))
                 else:
                     processed_tools.append(tool)
+            processed_tools = [
+                dedupe_tool_calls(tool) for tool in processed_tools
+            ]
 
         dspy_solver = None
 
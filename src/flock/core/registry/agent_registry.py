@@ -32,15 +32,16 @@ class Registry:
 
     def _initialize(self):
         with tracer.start_as_current_span("Registry._initialize"):
-            self._agents: list[FlockAgent] = []
-            self._tools: list[tuple[str, Callable]] = []
+            self._agents: dict[str, FlockAgent] = {}
+            self._tools: dict[str, Callable] = {}
             logger.info("Registry initialized", agents_count=0, tools_count=0)
 
     def register_tool(self, tool_name: str, tool: Callable) -> None:
         with tracer.start_as_current_span("Registry.register_tool") as span:
             span.set_attribute("tool_name", tool_name)
             try:
-                self._tools.append((tool_name, tool))
+                # The first tool registered under a name wins.
+                self._tools.setdefault(tool_name, tool)
                 logger.info("Tool registered", tool_name=tool_name)
             except Exception as e:
                 logger.error(
@@ -53,7 +54,8 @@ class Registry:
         with tracer.start_as_current_span("Registry.register_agent") as span:
             span.set_attribute("agent_name", agent.name)
             try:
-                self._agents.append(agent)
+                # The first agent registered under a name wins.
+                self._agents.setdefault(agent.name, agent)
                 logger.info("Agent registered", agent=agent.name)
             except Exception as e:
                 logger.error(
@@ -66,11 +68,11 @@ class Registry:
         with tracer.start_as_current_span("Registry.get_agent") as span:
             span.set_attribute("search_agent_name", name)
             try:
-                for agent in self._agents:
-                    if agent.name == name:
-                        logger.info("Agent found", agent=name)
-                        span.set_attribute("found", True)
-                        return agent
+                agent = self._agents.get(name)
+                if agent is not None:
+                    logger.info("Agent found", agent=name)
+                    span.set_attribute("found", True)
+                    return agent
                 logger.warning("Agent not found", agent=name)
                 span.set_attribute("found", False)
                 return None
@@ -83,11 +85,11 @@ class Registry:
         with tracer.start_as_current_span("Registry.get_tool") as span:
             span.set_attribute("search_tool_name", name)
             try:
-                for tool_name, tool in self._tools:
-                    if tool_name == name:
-                        logger.info("Tool found", tool=name)
-                        span.set_attribute("found", True)
-                        return tool
+                tool = self._tools.get(name)
+                if tool is not None:
+                    logger.info("Tool found", tool=name)
+                    span.set_attribute("found", True)
+                    return tool
                 logger.warning("Tool not found", tool=name)
                 span.set_attribute("found", False)
                 return None
@@ -0,0 +1,20 @@
+"""Shared HTTP client for the built-in tools."""
+
+import atexit
+import functools
+
+import httpx
+
+
+@functools.lru_cache(maxsize=1)
+def shared_client() -> httpx.Client:
+    """Return the process-wide HTTP client used by tools, creating it on first use.
+
+    Reusing one client keeps connections alive between tool calls instead of
+    paying a TCP and TLS handshake for every request.
+    """
+    client = httpx.Client(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+    atexit.register(client.close)
+    return client
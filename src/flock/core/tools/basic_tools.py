@@ -4,78 +4,72 @@ import importlib
 import os
 from typing import Literal
 
+from flock.core.cache.tool_cache import read_only_tool
 from flock.core.logging.trace_and_logged import traced_and_logged
 from flock.interpreter.python_interpreter import PythonInterpreter
 
 
+@read_only_tool
 @traced_and_logged
 def web_search_tavily(query: str):
     if importlib.util.find_spec("tavily") is not None:
         from tavily import TavilyClient
 
         client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
-        try:
-            response = client.search(query, include_answer=True)  # type: ignore
-            return response
-        except Exception:
-            raise
+        response = client.search(query, include_answer=True)  # type: ignore
+        return response
     else:
         raise ImportError(
             "Optional tool dependencies not installed. Install with 'pip install flock-core[tools]'."
         )
 
 
+@read_only_tool
 @traced_and_logged
 def web_search_duckduckgo(
     keywords: str, search_type: Literal["news", "web"] = "web"
 ):
-    try:
-        from duckduckgo_search import DDGS
+    from duckduckgo_search import DDGS
 
-        if search_type == "news":
-            response = DDGS().news(keywords)
-        else:
-            response = DDGS().text(keywords)
+    if search_type == "news":
+        response = DDGS().news(keywords)
+    else:
+        response = DDGS().text(keywords)
 
-        return response
-    except Exception:
-        raise
+    return response
 
 
+@read_only_tool
 @traced_and_logged
 def get_web_content_as_markdown(url: str):
     if (
         importlib.util.find_spec("httpx") is not None
         and importlib.util.find_spec("markdownify") is not None
     ):
-        import httpx
         from markdownify import markdownify as md
 
-        try:
-            response = httpx.get(url)
-            response.raise_for_status()
-            markdown = md(response.text)
-            return markdown
-        except Exception:
-            raise
+        from flock.core.tools._http import shared_client
+
+        response = shared_client().get(url)
+        response.raise_for_status()
+        markdown = md(response.text)
+        return markdown
     else:
         raise ImportError(
             "Optional tool dependencies not installed. Install with 'pip install flock-core[tools]'."
         )
 
 
+@read_only_tool
 @traced_and_logged
 def get_anything_as_markdown(url_or_file_path: str):
     if importlib.util.find_spec("docling") is not None:
         from docling.document_converter import DocumentConverter
 
-        try:
-            converter = DocumentConverter()
-            result = converter.convert(url_or_file_path)
-            markdown = result.document.export_to_markdown()
-            return markdown
-        except Exception:
-            raise
+        converter = DocumentConverter()
+        result = converter.convert(url_or_file_path)
+        markdown = result.document.export_to_markdown()
+        return markdown
     else:
         raise ImportError(
             "Optional tool dependencies not installed. Install with 'pip install flock-core[all-tools]'."
@@ -84,56 +78,50 @@ def get_anything_as_markdown(url_or_file_path: str):
 
 @traced_and_logged
 def evaluate_math(expression: str) -> float:
-    try:
-        result = PythonInterpreter(
-            {},
-            [
-                "os",
-                "math",
-                "random",
-                "datetime",
-                "time",
-                "string",
-                "collections",
-                "itertools",
-                "functools",
-                "typing",
-                "enum",
-                "json",
-                "ast",
-            ],
-            verbose=True,
-        ).execute(expression)
-        return result
-    except Exception:
-        raise
+    result = PythonInterpreter(
+        {},
+        [
+            "os",
+            "math",
+            "random",
+            "datetime",
+            "time",
+            "string",
+            "collections",
+            "itertools",
+            "functools",
+            "typing",
+            "enum",
+            "json",
+            "ast",
+        ],
+        verbose=True,
+    ).execute(expression)
+    return result
 
 
 @traced_and_logged
 def code_eval(python_code: str) -> str:
-    try:
-        result = PythonInterpreter(
-            {},
-            [
-                "os",
-                "math",
-                "random",
-                "datetime",
-                "time",
-                "string",
-                "collections",
-                "itertools",
-                "functools",
-                "typing",
-                "enum",
-                "json",
-                "ast",
-            ],
-            verbose=True,
-        ).execute(python_code)
-        return result
-    except Exception:
-        raise
+    result = PythonInterpreter(
+        {},
+        [
+            "os",
+            "math",
+            "random",
+            "datetime",
+            "time",
+            "string",
+            "collections",
+            "itertools",
+            "functools",
+            "typing",
+            "enum",
+            "json",
+            "ast",
+        ],
+        verbose=True,
+    ).execute(python_code)
+    return result
 
 
 @traced_and_logged
@@ -180,18 +168,12 @@ def json_parse_safe(text: str) -> dict:
 
 @traced_and_logged
 def save_to_file(content: str, filename: str):
-    try:
-        with open(filename, "w") as f:
-            f.write(content)
-    except Exception:
-        raise
+    with open(filename, "w") as f:
+        f.write(content)
 
 
 @traced_and_logged
 def read_from_file(filename: str) -> str:
-    try:
-        with open(filename) as f:
-            content = f.read()
-        return content
-    except Exception:
-        raise
+    with open(filename) as f:
+        content = f.read()
+    return content
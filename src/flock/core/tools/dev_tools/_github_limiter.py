@@ -0,0 +1,123 @@
+"""Client-side rate limiting and retries for the GitHub tools."""
+
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from flock.config import GITHUB_CONCURRENCY, GITHUB_RPS
+from flock.core.logging.logging import get_logger
+
+logger = get_logger("tools")
+
+MAX_ATTEMPTS = 5
+MAX_BACKOFF = 30.0
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_bucket = _TokenBucket(GITHUB_RPS)
+_in_flight = threading.BoundedSemaphore(GITHUB_CONCURRENCY)
+
+
+@contextmanager
+def gh_limiter() -> Iterator[None]:
+    """Hold a GitHub request slot: caps both request rate and requests in flight."""
+    with _in_flight:
+        _bucket.acquire()
+        yield
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Return the seconds a Retry-After header asks for, or None if unparseable.
+
+    The header is either a number of seconds or an HTTP date.
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """Return how long to wait before retrying `response`, or None if it is final."""
+    if response.status_code not in (403, 429):
+        return None
+    headers = response.headers
+    backoff = min(2**attempt, MAX_BACKOFF) + random.uniform(0, 1)
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        delay = _parse_retry_after(retry_after)
+        return backoff if delay is None else min(delay, MAX_BACKOFF)
+    if headers.get("x-ratelimit-remaining") == "0":
+        try:
+            reset = float(headers.get("x-ratelimit-reset"))
+        except (TypeError, ValueError):
+            return backoff
+        return min(max(reset - time.time(), 1.0), MAX_BACKOFF)
+    if response.status_code == 403 and "rate limit" not in response.text:
+        # A plain 403 is a permission error, retrying will not help.
+        return None
+    return backoff
+
+
+def gh_request(
+    client: httpx.Client, method: str, url: str, **kwargs
+) -> httpx.Response:
+    """Send a GitHub API request through the limiter, retrying on rate limits.
+
+    Args:
+        client: The HTTP client to send the request with.
+        method: The HTTP method, e.g. "GET" or "PUT".
+        url: The GitHub API URL.
+        **kwargs: Passed through to `client.request`.
+
+    Returns:
+        The last response received.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        with gh_limiter():
+            response = client.request(method, url, **kwargs)
+        delay = _retry_delay(response, attempt)
+        if delay is None or attempt == MAX_ATTEMPTS - 1:
+            return response
+        logger.warning(
+            "GitHub rate limit hit, retrying",
+            status=response.status_code,
+            delay=delay,
+        )
+        time.sleep(delay)
+    return response
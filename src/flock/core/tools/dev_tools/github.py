@@ -3,9 +3,9 @@
 import base64
 import os
 
-import httpx
-
 from flock.core.logging.trace_and_logged import traced_and_logged
+from flock.core.tools._http import shared_client
+from flock.core.tools.dev_tools._github_limiter import gh_request
 
 
 @traced_and_logged
@@ -22,7 +22,9 @@ def create_user_stories_as_github_issue(title: str, body: str) -> str:
     issue_body = body
 
     payload = {"title": issue_title, "body": issue_body}
-    response = httpx.post(url, json=payload, headers=headers)
+    response = gh_request(
+        shared_client(), "POST", url, json=payload, headers=headers
+    )
 
     if response.status_code == 201:
         return "Issue created successfully."
@@ -45,40 +47,44 @@ def upload_readme(content: str):
 
     encoded_content = base64.b64encode(content.encode()).decode()
 
-    with httpx.Client() as client:
-        response = client.get(
-            GITHUB_API_URL,
-            headers={
-                "Authorization": f"Bearer {GITHUB_TOKEN}",
-                "Accept": "application/vnd.github.v3+json",
-            },
-        )
-
-        data = response.json()
-        sha = data.get("sha", None)
-
-        payload = {
-            "message": "Updating README.md",
-            "content": encoded_content,
-            "branch": "main",
-        }
-
-        if sha:
-            payload["sha"] = sha
-
-        response = client.put(
-            GITHUB_API_URL,
-            json=payload,
-            headers={
-                "Authorization": f"Bearer {GITHUB_TOKEN}",
-                "Accept": "application/vnd.github.v3+json",
-            },
-        )
+    client = shared_client()
+    response = gh_request(
+        client,
+        "GET",
+        GITHUB_API_URL,
+        headers={
+            "Authorization": f"Bearer {GITHUB_TOKEN}",
+            "Accept": "application/vnd.github.v3+json",
+        },
+    )
+
+    data = response.json()
+    sha = data.get("sha", None)
+
+    payload = {
+        "message": "Updating README.md",
+        "content": encoded_content,
+        "branch": "main",
+    }
 
-        if response.status_code in [200, 201]:
-            print("README.md successfully uploaded/updated!")
-        else:
-            print("Failed to upload README.md:", response.json())
+    if sha:
+        payload["sha"] = sha
+
+    response = gh_request(
+        client,
+        "PUT",
+        GITHUB_API_URL,
+        json=payload,
+        headers={
+            "Authorization": f"Bearer {GITHUB_TOKEN}",
+            "Accept": "application/vnd.github.v3+json",
+        },
+    )
+
+    if response.status_code in [200, 201]:
+        print("README.md successfully uploaded/updated!")
+    else:
+        print("Failed to upload README.md:", response.json())
 
 
 @traced_and_logged
@@ -112,44 +118,48 @@ def create_files(file_paths) -> str:
 
         encoded_content = base64.b64encode(b"#created by flock").decode()
 
-        with httpx.Client() as client:
-            for file_path in file_paths:
-                GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/contents/{file_path}"
-
-                response = client.get(
-                    GITHUB_API_URL,
-                    headers={
-                        "Authorization": f"token {GITHUB_TOKEN}",
-                        "Accept": "application/vnd.github.v3+json",
-                    },
-                )
-
-                data = response.json()
-                sha = data.get("sha", None)
-
-                payload = {
-                    "message": f"Creating {file_path}",
-                    "content": encoded_content,
-                    "branch": "main",
-                }
-
-                if sha:
-                    print(f"Skipping {file_path}, file already exists.")
-                    continue
-
-                response = client.put(
-                    GITHUB_API_URL,
-                    json=payload,
-                    headers={
-                        "Authorization": f"token {GITHUB_TOKEN}",
-                        "Accept": "application/vnd.github.v3+json",
-                    },
-                )
-
-                if response.status_code in [200, 201]:
-                    print(f"{file_path} successfully created!")
-                else:
-                    print(f"Failed to create {file_path}:", response.json())
+        client = shared_client()
+        for file_path in file_paths:
+            GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/contents/{file_path}"
+
+            response = gh_request(
+                client,
+                "GET",
+                GITHUB_API_URL,
+                headers={
+                    "Authorization": f"token {GITHUB_TOKEN}",
+                    "Accept": "application/vnd.github.v3+json",
+                },
+            )
+
+            data = response.json()
+            sha = data.get("sha", None)
+
+            payload = {
+                "message": f"Creating {file_path}",
+                "content": encoded_content,
+                "branch": "main",
+            }
+
+            if sha:
+                print(f"Skipping {file_path}, file already exists.")
+                continue
+
+            response = gh_request(
+                client,
+                "PUT",
+                GITHUB_API_URL,
+                json=payload,
+                headers={
+                    "Authorization": f"token {GITHUB_TOKEN}",
+                    "Accept": "application/vnd.github.v3+json",
+                },
+            )
+
+            if response.status_code in [200, 201]:
+                print(f"{file_path} successfully created!")
+            else:
+                print(f"Failed to create {file_path}:", response.json())
 
         return "Files created successfully."
 
@@ -30,64 +30,40 @@ class Serializable(ABC):
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        try:
-            return json.dumps(self.to_dict())
-        except Exception:
-            raise
+        return json.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls: type[T], json_str: str) -> T:
         """Create instance from JSON string."""
-        try:
-            return cls.from_dict(json.loads(json_str))
-        except Exception:
-            raise
+        return cls.from_dict(json.loads(json_str))
 
     def to_msgpack(self, path: Path | None = None) -> bytes:
         """Serialize to msgpack bytes."""
-        try:
-            msgpack_bytes = msgpack.packb(self.to_dict())
-            if path:
-                path.write_bytes(msgpack_bytes)
-            return msgpack_bytes
-        except Exception:
-            raise
+        msgpack_bytes = msgpack.packb(self.to_dict())
+        if path:
+            path.write_bytes(msgpack_bytes)
+        return msgpack_bytes
 
     @classmethod
     def from_msgpack(cls: type[T], msgpack_bytes: bytes) -> T:
         """Create instance from msgpack bytes."""
-        try:
-            return cls.from_dict(msgpack.unpackb(msgpack_bytes))
-        except Exception:
-            raise
+        return cls.from_dict(msgpack.unpackb(msgpack_bytes))
 
     @classmethod
     def from_msgpack_file(cls: type[T], path: Path) -> T:
         """Create instance from msgpack file."""
-        try:
-            return cls.from_msgpack(path.read_bytes())
-        except Exception:
-            raise
+        return cls.from_msgpack(path.read_bytes())
 
     def to_pickle(self) -> bytes:
         """Serialize to pickle bytes."""
-        try:
-            return cloudpickle.dumps(self)
-        except Exception:
-            raise
+        return cloudpickle.dumps(self)
 
     @classmethod
     def from_pickle(cls, pickle_bytes: bytes) -> T:
         """Create instance from pickle bytes."""
-        try:
-            return cloudpickle.loads(pickle_bytes)
-        except Exception:
-            raise
+        return cloudpickle.loads(pickle_bytes)
 
     @classmethod
     def from_pickle_file(cls: type[T], path: Path) -> T:
         """Create instance from pickle file."""
-        try:
-            return cls.from_pickle(path.read_bytes())
-        except Exception:
-            raise
+        return cls.from_pickle(path.read_bytes())
@@ -11,6 +11,11 @@ from flock.core.flock_agent import FlockAgent, HandOff
 from flock.core.logging.formatters.base_formatter import FormatterOptions
 from flock.core.logging.formatters.formatter_factory import FormatterFactory
 from flock.core.logging.logging import get_logger
+from flock.core.logging.span_payload import (
+    format_payload,
+    set_payload_attribute,
+    should_record_payload,
+)
 from flock.core.registry.agent_registry import Registry
 from flock.core.util.input_resolver import resolve_inputs
 
@@ -56,16 +61,18 @@ async def run_agent(
                 agent_inputs = resolve_inputs(
                     agent.input, context, previous_agent_name
                 )
-                iter_span.add_event(
-                    "resolved inputs", attributes={"inputs": str(agent_inputs)}
-                )
+                if should_record_payload(iter_span):
+                    iter_span.add_event(
+                        "resolved inputs",
+                        attributes={"inputs": format_payload(agent_inputs)},
+                    )
 
                 # Execute the agent with its own span.
                 with tracer.start_as_current_span("execute_agent") as exec_span:
                     logger.info("Executing agent", agent=agent.name)
                     try:
                         result = await agent.run(agent_inputs)
-                        exec_span.set_attribute("result", str(result))
+                        set_payload_attribute(exec_span, "result", result)
                         logger.debug(
                             "Agent execution completed", agent=agent.name
                         )
@@ -142,6 +149,7 @@ async def run_agent(
                     timestamp=datetime.now().isoformat(),
                     hand_off=handoff_data,
                     called_from=previous_agent_name,
+                    copy_data=False,
                 )
                 previous_agent_name = agent.name
 
@@ -0,0 +1,70 @@
+"""Temporal data converter that encodes JSON payloads with orjson."""
+
+import dataclasses
+from typing import Any
+
+import orjson
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    AdvancedJSONEncoder,
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    JSONPlainPayloadConverter,
+    value_to_type,
+)
+
+
+class OrjsonPayloadConverter(JSONPlainPayloadConverter):
+    """Drop-in replacement for the "json/plain" converter backed by orjson.
+
+    Payloads use the same "json/plain" encoding as the default converter, so
+    workers and clients using either converter can read each other's data.
+    Values orjson cannot encode fall back to the stdlib encoder.
+    """
+
+    _default = staticmethod(AdvancedJSONEncoder().default)
+
+    def to_payload(self, value: Any) -> Payload | None:
+        """See base class."""
+        try:
+            data = orjson.dumps(
+                value,
+                default=self._default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            return super().to_payload(value)
+        return Payload(metadata={"encoding": self.encoding.encode()}, data=data)
+
+    def from_payload(
+        self, payload: Payload, type_hint: type | None = None
+    ) -> Any:
+        """See base class."""
+        try:
+            obj = orjson.loads(payload.data)
+        except orjson.JSONDecodeError as err:
+            raise RuntimeError("Failed parsing") from err
+        if type_hint:
+            obj = value_to_type(type_hint, obj, self._custom_type_converters)
+        return obj
+
+
+class FlockPayloadConverter(CompositePayloadConverter):
+    """Default Temporal payload converters with JSON handled by orjson."""
+
+    def __init__(self) -> None:
+        """Create the converter from the default set of encoders."""
+        super().__init__(
+            *(
+                OrjsonPayloadConverter()
+                if isinstance(converter, JSONPlainPayloadConverter)
+                else converter
+                for converter in DefaultPayloadConverter.default_encoding_payload_converters
+            )
+        )
+
+
+flock_data_converter = dataclasses.replace(
+    DataConverter.default, payload_converter_class=FlockPayloadConverter
+)
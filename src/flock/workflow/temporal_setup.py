@@ -1,19 +1,85 @@
 import asyncio
+import functools
 import uuid
 
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from flock.workflow.data_converter import flock_data_converter
+
+# Clients keyed by (address, namespace), stored as the connecting task so
+# concurrent first calls share one connection. A client is only reused on
+# the event loop it was created on.
+_clients: dict[
+    tuple[str, str], tuple[asyncio.AbstractEventLoop, asyncio.Task[Client]]
+] = {}
+
+
+def _forget_failed_client(key: tuple[str, str], task: asyncio.Task) -> None:
+    # Drop a failed connection attempt so the next call tries again.
+    if task.cancelled() or task.exception() is not None:
+        cached = _clients.get(key)
+        if cached is not None and cached[1] is task:
+            del _clients[key]
+
+
+async def get_client(
+    address: str | None = None, namespace: str = "default"
+) -> Client:
+    """Return a shared Temporal client, connecting on first use.
+
+    The address defaults to the TEMPORAL_SERVER_URL setting.
+    """
+    if address is None:
+        # Imported here: flock.config imports flock.core, which imports us.
+        from flock.config import TEMPORAL_SERVER_URL
+
+        address = TEMPORAL_SERVER_URL
+    loop = asyncio.get_running_loop()
+    key = (address, namespace)
+    cached = _clients.get(key)
+    if cached is None or cached[0] is not loop:
+        connecting = loop.create_task(
+            Client.connect(
+                address,
+                namespace=namespace,
+                data_converter=flock_data_converter,
+            )
+        )
+        connecting.add_done_callback(
+            functools.partial(_forget_failed_client, key)
+        )
+        cached = _clients[key] = (loop, connecting)
+    # Shielded so a cancelled caller does not cancel the shared connection.
+    return await asyncio.shield(cached[1])
+
 
 async def create_temporal_client() -> Client:
-    client = await Client.connect("localhost:7233")
-    return client
+    return await get_client()
+
+
+# Running in-process workers keyed by (workflow, activity), so repeated runs
+# reuse the worker started by the first one on the same event loop.
+_workers: dict[tuple, asyncio.Task] = {}
 
 
-async def setup_worker(workflow, activity) -> Client:
+async def _run_flock_worker(workflow, activity) -> None:
     worker_client = await create_temporal_client()
     worker = Worker(worker_client, task_queue="flock-queue", workflows=[workflow], activities=[activity])
-    asyncio.create_task(worker.run())
+    await worker.run()
+
+
+async def setup_worker(workflow, activity) -> None:
+    key = (workflow, activity)
+    running = _workers.get(key)
+    if (
+        running is not None
+        and not running.done()
+        and running.get_loop() is asyncio.get_running_loop()
+    ):
+        return
+    # Registered before the first await, so concurrent runs start one worker.
+    _workers[key] = asyncio.create_task(_run_flock_worker(workflow, activity))
     await asyncio.sleep(1)
 
 
@@ -25,14 +91,11 @@ async def run_worker(client: Client, task_queue: str, workflows, activities):
 async def run_activity(client: Client, name: str, func, param):
     run_id = f"{name}_{uuid.uuid4().hex[:4]}"
 
-    try:
-        result = await client.execute_activity(
-            func,
-            param,
-            id=run_id,
-            task_queue="flock-queue",
-            start_to_close_timeout=300,  # e.g., 5 minutes
-        )
-        return result
-    except Exception:
-        raise
+    result = await client.execute_activity(
+        func,
+        param,
+        id=run_id,
+        task_queue="flock-queue",
+        start_to_close_timeout=300,  # e.g., 5 minutes
+    )
+    return result
@@ -0,0 +1,188 @@
+# test_context.py
+
+from dataclasses import asdict
+from datetime import datetime
+
+from flock.core.context.context import AgentRunRecord, FlockContext
+
+
+# ------------------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------------------
+def make_context() -> FlockContext:
+    context = FlockContext(run_id="run_1")
+    context.set_variable("flock.topic", "bees")
+    context.record("outline_agent", {"title": "Bees"}, datetime(2025, 1, 1).isoformat(), None, "")
+    context.record("draft_agent", {"content": "Buzz"}, datetime(2025, 1, 2).isoformat(), None, "outline_agent")
+    context.add_agent_definition(FlockContext, "outline_agent", {"name": "outline_agent"})
+    return context
+
+
+# ------------------------------------------------------------------------------
+# Tests for serialization
+# ------------------------------------------------------------------------------
+def test_to_dict_from_dict_roundtrip():
+    """
+    Test that a context survives a to_dict/from_dict round trip.
+    """
+    context = make_context()
+    data = context.to_dict()
+
+    assert data["history"][0] == {
+        "agent": "outline_agent",
+        "data": {"title": "Bees"},
+        "timestamp": "2025-01-01T00:00:00",
+        "hand_off": None,
+        "called_from": "",
+    }
+
+    restored = FlockContext.from_dict(data)
+    assert restored.run_id == "run_1"
+    assert restored.state == context.state
+    assert [record.agent for record in restored.history] == ["outline_agent", "draft_agent"]
+    assert isinstance(restored.history[1], AgentRunRecord)
+    assert restored.get_agent_definition("outline_agent").agent_data == {"name": "outline_agent"}
+
+
+def test_to_dict_converts_datetimes():
+    """
+    Test that datetime timestamps in history records are serialized as ISO strings.
+    """
+    context = FlockContext()
+    context.history.append(AgentRunRecord(agent="a", timestamp=datetime(2025, 1, 1)))
+    assert context.to_dict()["history"][0]["timestamp"] == "2025-01-01T00:00:00"
+
+
+def test_to_dict_matches_asdict_without_copying_leaves():
+    """
+    Test that to_dict flattens nested dataclasses like asdict but keeps leaf objects as they are.
+    """
+    leaf = object()
+    context = make_context()
+    context.set_variable("leaf", leaf)
+    context.set_variable("record", AgentRunRecord(agent="nested"))
+
+    data = context.to_dict()
+
+    assert data["state"]["leaf"] is leaf
+    assert data["state"]["record"] == asdict(AgentRunRecord(agent="nested"))
+    assert data["state"]["flock.topic"] == "bees"
+
+
+# ------------------------------------------------------------------------------
+# Tests for history lookups
+# ------------------------------------------------------------------------------
+def test_get_agent_history():
+    """
+    Test that get_agent_history returns only the given agent's records, in order.
+    """
+    context = make_context()
+    context.record("outline_agent", {"title": "Wasps"}, "", None, "draft_agent")
+
+    history = context.get_agent_history("outline_agent")
+    assert [record.data["title"] for record in history] == ["Bees", "Wasps"]
+    assert context.get_agent_history("unknown_agent") == []
+
+
+def test_get_most_recent_value():
+    """
+    Test that get_most_recent_value returns the latest recorded value, including
+    records appended to or replacing the history directly.
+    """
+    context = make_context()
+    assert context.get_most_recent_value("title") == "Bees"
+    assert context.get_most_recent_value("missing") is None
+
+    context.record("outline_agent", {"title": "Wasps"}, "", None, "")
+    assert context.get_most_recent_value("title") == "Wasps"
+
+    context.history.append(AgentRunRecord(agent="manual", data={"title": "Ants"}))
+    assert context.get_most_recent_value("title") == "Ants"
+
+    context.history = context.history[:1]
+    assert context.get_most_recent_value("title") == "Bees"
+    assert context.get_most_recent_value("content") is None
+
+
+def test_history_index_sees_in_place_changes():
+    """
+    Test that lookups follow a replaced last record and results mutated after
+    being recorded with copy_data=False.
+    """
+    context = make_context()
+    data = {"title": "Wasps"}
+    context.record("review_agent", data, "", None, "", copy_data=False)
+    assert context.get_most_recent_value("title") == "Wasps"
+
+    data["title"] = "Hornets"
+    assert context.get_most_recent_value("title") == "Hornets"
+
+    context.history[-1] = AgentRunRecord(agent="manual", data={"title": "Ants"})
+    assert context.get_most_recent_value("title") == "Ants"
+    assert context.get_agent_history("review_agent") == []
+
+    del context.history[-1].data["title"]
+    assert context.get_most_recent_value("title") == "Bees"
+
+
+def test_next_input_for():
+    """
+    Test that next_input_for resolves single and multiple input keys from state.
+    """
+    class Agent:
+        name = "agent"
+        input = "flock.topic"
+
+    context = make_context()
+    assert context.next_input_for(Agent) == "bees"
+
+    Agent.input = "flock.topic, outline_agent.title"
+    assert context.next_input_for(Agent) == {"flock.topic": "bees", "outline_agent.title": "Bees"}
+
+
+def test_from_dict_keeps_state_values_as_data():
+    """
+    Test that state values shaped like records are not turned into dataclasses.
+    """
+    data = make_context().to_dict()
+    data["state"]["event"] = {"timestamp": "2025-01-01T00:00:00", "kind": "tick"}
+    restored = FlockContext.from_dict(data)
+    assert restored.get_variable("event") == {"timestamp": "2025-01-01T00:00:00", "kind": "tick"}
+    assert restored.history[0].timestamp == datetime(2025, 1, 1)
+
+
+def test_deepcopy_is_independent():
+    """
+    Test that deepcopy returns an equal context that shares no mutable state.
+    """
+    context = make_context()
+    copied = context.deepcopy()
+    assert copied == context
+
+    copied.set_variable("flock.topic", "wasps")
+    copied.history[0].data["title"] = "Wasps"
+    copied.record("draft_agent", {"content": "Bzz"}, "", None, "")
+    assert context.get_variable("flock.topic") == "bees"
+    assert context.history[0].data["title"] == "Bees"
+    assert len(context.get_agent_history("draft_agent")) == 1
+    assert len(copied.get_agent_history("draft_agent")) == 2
+
+
+# ------------------------------------------------------------------------------
+# Tests for variables
+# ------------------------------------------------------------------------------
+def test_set_variable_skips_compare_when_unobserved():
+    """
+    Test that set_variable does not compare values when logging and tracing are off.
+    """
+
+    class NoCompare:
+        def __eq__(self, other):
+            raise AssertionError("values should not be compared")
+
+        __hash__ = object.__hash__
+
+    context = FlockContext()
+    context.set_variable("value", NoCompare())
+    context.set_variable("value", NoCompare())
+    assert isinstance(context.get_variable("value"), NoCompare)
@@ -100,7 +100,7 @@ class TestFlock:
         flock_instance.add_agent(agent)
         assert agent.name in flock_instance.agents
         # Check that dummy_tool was registered in the registry.
-        registered_tools = [tool_name for tool_name, _ in flock_instance.registry._tools]
+        registered_tools = list(flock_instance.registry._tools)
         assert dummy_tool.__name__ in registered_tools
 
     def test_add_tool(self, flock_instance):
@@ -108,7 +108,7 @@ class TestFlock:
         def sample_tool():
             pass
         flock_instance.add_tool("sample_tool", sample_tool)
-        registered_tools = [tool_name for tool_name, _ in flock_instance.registry._tools]
+        registered_tools = list(flock_instance.registry._tools)
         assert "sample_tool" in registered_tools
 
 
@@ -168,7 +168,9 @@ class TestFlock:
             mock_span = AsyncMock()
             mock_tracer.start_as_current_span.return_value.__aenter__.return_value = mock_span
     
-            result = await flock_instance.run_async(dummy_agent, context=custom_context)
+            result = await flock_instance.run_async(
+                dummy_agent, input={"query": "dummy_value"}, context=custom_context
+            )
 
         assert dict(result) == {'inputs': {'query': 'dummy_value'}, 'result': 'success'}
 
@@ -189,6 +191,58 @@ class TestFlock:
             
             assert dict(result) == {"result": "success"}
 
+    @pytest.mark.asyncio
+    async def test_run_async_does_not_mutate_input(self, flock_instance, dummy_agent):
+        """Test that prompted values are neither written to the caller's input nor kept between runs."""
+        dummy_agent.input = "query: str"
+        caller_input = {}
+
+        with patch("flock.core.flock.run_local_workflow", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = {"result": "success"}
+
+            with patch.object(Prompt, "ask", return_value="provided_value") as mock_ask:
+                await flock_instance.run_async(dummy_agent, input=caller_input)
+                await flock_instance.run_async(dummy_agent)
+
+        assert caller_input == {}
+        assert mock_ask.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_async_adds_agent_definitions(self, flock_instance, dummy_agent):
+        """Test that agent definitions are added to the context when a run starts, not in add_agent."""
+        dummy_agent.input = ""
+        flock_instance.add_agent(dummy_agent)
+        assert flock_instance.context.get_agent_definition(dummy_agent.name) is None
+
+        with patch("flock.core.flock.run_local_workflow", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = {"result": "success"}
+            await flock_instance.run_async(dummy_agent)
+
+        definition = flock_instance.context.get_agent_definition(dummy_agent.name)
+        assert definition.agent_data == dummy_agent.to_dict()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "enable_logging, endpoint, expected",
+        [(False, "", False), (True, "", True), (False, "localhost:4317", True)],
+    )
+    async def test_run_async_sets_up_tracing_on_demand(
+        self, monkeypatch, dummy_agent, enable_logging, endpoint, expected
+    ):
+        """Test that tracing is set up on the first run, not in __init__, and only when logging or OTLP is configured."""
+        import flock.config
+
+        monkeypatch.setattr(flock.config, "OTEL_EXPORTER_OTLP_ENDPOINT", endpoint)
+        with patch("flock.config.setup_tracing") as mock_setup:
+            flock = Flock(local_debug=True, enable_logging=enable_logging)
+            mock_setup.assert_not_called()
+            dummy_agent.input = ""
+            with patch("flock.core.flock.run_local_workflow", new_callable=AsyncMock) as mock_run:
+                mock_run.return_value = {"result": "success"}
+                await flock.run_async(dummy_agent)
+
+        assert mock_setup.called is expected
+
 
     @pytest.mark.asyncio
     async def test_run_async_temporal(self, flock_instance, dummy_agent):
@@ -83,6 +83,27 @@ def test_to_dict_from_dict_roundtrip():
     assert new_agent.tools[0](3) == dummy_tool(3)  # should equal 6
 
 
+def test_from_dict_skips_unpickling_plain_strings(monkeypatch):
+    """
+    Test that from_dict only tries to unpickle strings that look like pickles.
+    """
+    agent = DummyAgent(description="deadbeef")
+    agent_dict = agent.to_dict()
+
+    loaded = []
+    real_loads = cloudpickle.loads
+
+    def counting_loads(data):
+        loaded.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(cloudpickle, "loads", counting_loads)
+    new_agent = DummyAgent.from_dict(agent_dict)
+
+    assert new_agent.description == "deadbeef"
+    assert len(loaded) == len(agent_dict["tools"])
+
+
 
 @pytest.mark.asyncio
 async def test_evaluate():
@@ -95,6 +116,27 @@ async def test_evaluate():
     result = await agent.evaluate(inputs)
     assert result == {"result": 10, "x": 5}
 
+@pytest.mark.asyncio
+async def test_run_many_limits_concurrency():
+    """
+    Test that run_many returns results in input order and respects max_concurrency.
+    """
+    running = 0
+    peak = 0
+
+    class SlowAgent(DummyAgent):
+        async def evaluate(self, inputs: dict[str, Any]) -> dict[str, Any]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await super().evaluate(inputs)
+
+    results = await SlowAgent().run_many([{"x": i} for i in range(6)], max_concurrency=2)
+    assert [result["result"] for result in results] == [0, 2, 4, 6, 8, 10]
+    assert peak == 2
+
 def test_build_clean_signature():
     """
     Test the prompt parser mixin functionality inherited by FlockAgent.
@@ -145,3 +187,434 @@ def test_create_dspy_signature_class(monkeypatch):
     assert signature_class.__doc__ == agent.description
     # Also check that __annotations__ is an empty dict.
     assert signature_class.__annotations__ == {}
+
+# ------------------------------------------------------------------------------
+# Test: result cache in evaluate
+# ------------------------------------------------------------------------------
+class _FakePrediction(dict):
+    def toDict(self):
+        return dict(self)
+
+
+def test_evaluate_uses_result_cache(monkeypatch):
+    """
+    Test that evaluate reuses a cached result for identical inputs when
+    cache_results is enabled, and re-runs the task when it is disabled.
+    """
+    from flock.core.cache.result_cache import result_cache
+    from flock.core.cache.lru import LRUCache
+    from flock.core.mixin import dspy_integration
+
+    result_cache.clear()
+    monkeypatch.setattr(dspy_integration, "_signature_classes", LRUCache(8))
+    calls = []
+
+    def fake_task(**inputs):
+        calls.append(inputs)
+        return _FakePrediction(result=inputs["x"] * 2)
+
+    monkeypatch.setattr(FlockAgent, "create_dspy_signature_class", lambda self, *args: object)
+    monkeypatch.setattr(FlockAgent, "_configure_language_model", lambda self: None)
+    monkeypatch.setattr(FlockAgent, "_select_task", lambda self, *args, **kwargs: fake_task)
+
+    agent = FlockAgent(name="cached_agent", input="x: int", output="result: int", cache_results=True)
+    first = asyncio.run(agent.evaluate({"x": 3}))
+    second = asyncio.run(agent.evaluate({"x": 3}))
+    assert first == second == {"result": 6, "x": 3}
+    assert len(calls) == 1
+
+    asyncio.run(agent.evaluate({"x": 4}))
+    assert len(calls) == 2
+
+    agent.cache_results = False
+    asyncio.run(agent.evaluate({"x": 3}))
+    assert len(calls) == 3
+    result_cache.clear()
+
+
+def test_result_cache_is_opt_in_and_isolates_results():
+    """
+    Test that result caching is off by default and that callers cannot mutate
+    cached results through the stored or returned objects.
+    """
+    from flock.core.cache.result_cache import ResultCache
+
+    assert FlockAgent(name="plain_agent").cache_results is False
+
+    cache = ResultCache()
+    result = {"items": [1, 2]}
+    cache.put("key", result)
+    result["items"].append(3)
+    cached = cache.get("key")
+    cached["items"].append(4)
+    assert cache.get("key") == {"items": [1, 2]}
+
+
+def test_evaluate_runs_task_in_worker_thread(monkeypatch):
+    """
+    Test that the blocking dspy task call does not run on the event loop thread.
+    """
+    import threading
+
+    threads = []
+
+    def fake_task(**inputs):
+        threads.append(threading.current_thread())
+        return _FakePrediction(result=inputs["x"])
+
+    monkeypatch.setattr(FlockAgent, "_get_dspy_signature", lambda self: object)
+    monkeypatch.setattr(FlockAgent, "_configure_language_model", lambda self: None)
+    monkeypatch.setattr(FlockAgent, "_select_task", lambda self, *args, **kwargs: fake_task)
+
+    agent = FlockAgent(name="threaded_agent", input="x: int", output="result: int", use_cache=False)
+    assert asyncio.run(agent.evaluate({"x": 1})) == {"result": 1, "x": 1}
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_result_cache_skips_unserializable_inputs():
+    """
+    Test that inputs without a stable JSON form produce no cache key.
+    """
+    from flock.core.cache.result_cache import ResultCache
+
+    agent = DummyAgent()
+    assert ResultCache.make_key(agent, {"x": 1}) == ResultCache.make_key(agent, {"x": 1})
+    assert ResultCache.make_key(agent, {"x": object()}) is None
+
+
+def test_result_cache_ignores_excluded_keys():
+    """
+    Test that cache_exclude_keys are left out of the cache key.
+    """
+    from flock.core.cache.result_cache import ResultCache
+
+    agent = DummyAgent(cache_exclude_keys=["context"])
+    key = ResultCache.make_key(agent, {"x": 1, "context": object()})
+    assert key is not None
+    assert key == ResultCache.make_key(agent, {"x": 1, "context": "other"})
+    assert key != ResultCache.make_key(agent, {"x": 2, "context": "other"})
+
+
+def test_result_cache_evicts_oldest_entry():
+    """
+    Test that the cache stays bounded and evicts the least recently used entry.
+    """
+    from flock.core.cache.result_cache import ResultCache
+
+    cache = ResultCache(max_size=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    cache.get("a")
+    cache.put("c", {"v": 3})
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+
+
+def test_dspy_signature_is_built_once_per_spec(monkeypatch):
+    """
+    Test that the dspy signature class is reused across evaluations and
+    rebuilt only when the agent's I/O spec changes.
+    """
+    from flock.core.cache.lru import LRUCache
+    from flock.core.mixin import dspy_integration
+
+    monkeypatch.setattr(dspy_integration, "_signature_classes", LRUCache(8))
+    built = []
+
+    def fake_create(self, name, description, fields_spec):
+        built.append(fields_spec)
+        return type("DummySignature_" + name, (), {})
+
+    monkeypatch.setattr(FlockAgent, "create_dspy_signature_class", fake_create)
+
+    agent = FlockAgent(name="signature_agent", input="x: int", output="result: int")
+    first = agent._get_dspy_signature()
+    assert agent._get_dspy_signature() is first
+    assert FlockAgent(name="signature_agent", input="x: int", output="result: int")._get_dspy_signature() is first
+    assert built == ["x: int -> result: int"]
+
+    agent.output = "result: str"
+    assert agent._get_dspy_signature() is not first
+    assert built == ["x: int -> result: int", "x: int -> result: str"]
+
+
+def test_select_task_reuses_built_task(monkeypatch):
+    """
+    Test that the dspy task is built once per signature, agent type and tools.
+    """
+    from flock.core.cache.lru import LRUCache
+    from flock.core.mixin import dspy_integration
+
+    monkeypatch.setattr(dspy_integration, "_tasks", LRUCache(8))
+    built = []
+
+    def fake_build(self, signature, agent_type_override):
+        built.append((signature, agent_type_override))
+        return object()
+
+    monkeypatch.setattr(FlockAgent, "_build_task", fake_build)
+
+    agent = DummyAgent()
+    task = agent._select_task("signature", None)
+    assert agent._select_task("signature", None) is task
+    assert agent._select_task("signature", "ChainOfThought") is not task
+    assert agent._select_task("other_signature", None) is not task
+    assert len(built) == 3
+
+
+def test_language_model_is_shared_per_model(monkeypatch):
+    """
+    Test that agents with the same model and cache setting share one dspy LM.
+    """
+    import sys
+    import types
+
+    from flock.core.cache.lru import LRUCache
+    from flock.core.mixin import dspy_integration
+
+    monkeypatch.setattr(dspy_integration, "_language_models", LRUCache(8))
+    configured = []
+    fake_dspy = types.SimpleNamespace(
+        LM=lambda model, cache: object(),
+        configure=lambda lm: configured.append(lm),
+    )
+    monkeypatch.setitem(sys.modules, "dspy", fake_dspy)
+
+    FlockAgent(name="a", model="m1")._configure_language_model()
+    FlockAgent(name="b", model="m1")._configure_language_model()
+    FlockAgent(name="c", model="m2")._configure_language_model()
+    assert configured[0] is configured[1]
+    assert configured[2] is not configured[0]
+
+
+def test_default_agent_keeps_dspy_lm_cache(monkeypatch):
+    """
+    Test that a default agent still builds its dspy LM with caching enabled.
+    """
+    import sys
+    import types
+
+    from flock.core.cache.lru import LRUCache
+    from flock.core.mixin import dspy_integration
+
+    monkeypatch.setattr(dspy_integration, "_language_models", LRUCache(8))
+    built = []
+    fake_dspy = types.SimpleNamespace(
+        LM=lambda model, cache: built.append(cache) or object(),
+        configure=lambda lm: None,
+    )
+    monkeypatch.setitem(sys.modules, "dspy", fake_dspy)
+
+    FlockAgent(name="default_agent", model="m1")._configure_language_model()
+    assert built == [True]
+
+
+def test_dspy_caches_are_bounded(monkeypatch):
+    """
+    Test that the dspy caches evict the least recently used entry when full.
+    """
+    from flock.core.cache.lru import LRUCache
+    from flock.core.mixin import dspy_integration
+
+    monkeypatch.setattr(dspy_integration, "_tasks", LRUCache(2))
+    built = []
+
+    def fake_build(self, signature, agent_type_override):
+        built.append(signature)
+        return object()
+
+    monkeypatch.setattr(FlockAgent, "_build_task", fake_build)
+
+    agent = DummyAgent()
+    first = agent._select_task("first", None)
+    agent._select_task("second", None)
+    assert agent._select_task("first", None) is first
+    agent._select_task("third", None)
+    assert len(dspy_integration._tasks) == 2
+    assert agent._select_task("first", None) is first
+    agent._select_task("second", None)
+    assert built == ["first", "second", "third", "second"]
+
+
+# ------------------------------------------------------------------------------
+# Test: tool call deduplication in run_many
+# ------------------------------------------------------------------------------
+def test_tool_calls_are_deduped_within_scope():
+    """
+    Test that identical tool calls run once inside a tool_call_scope and
+    normally outside of it.
+    """
+    from flock.core.cache.tool_cache import (
+        dedupe_tool_calls,
+        read_only_tool,
+        tool_call_scope,
+    )
+
+    calls = []
+
+    @read_only_tool
+    def lookup(term: str) -> str:
+        """Look a term up."""
+        calls.append(term)
+        return term.upper()
+
+    tool = dedupe_tool_calls(lookup)
+    assert tool.__name__ == "lookup"
+    assert tool.__doc__ == "Look a term up."
+
+    with tool_call_scope():
+        assert tool("bees") == tool("bees") == "BEES"
+        tool("wasps")
+    assert calls == ["bees", "wasps"]
+
+    tool("bees")
+    assert calls == ["bees", "wasps", "bees"]
+
+
+def test_only_read_only_tools_are_deduped():
+    """
+    Test that tools without the read_only_tool mark are never shared.
+    """
+    from flock.core.cache.tool_cache import dedupe_tool_calls, tool_call_scope
+
+    calls = []
+
+    def save(text: str) -> None:
+        calls.append(text)
+
+    assert dedupe_tool_calls(save) is save
+    with tool_call_scope():
+        save("notes")
+        save("notes")
+    assert calls == ["notes", "notes"]
+
+
+def test_concurrent_identical_tool_calls_run_once():
+    """
+    Test that identical calls from several threads wait for the first one.
+    """
+    import contextvars
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from flock.core.cache.tool_cache import (
+        dedupe_tool_calls,
+        read_only_tool,
+        tool_call_scope,
+    )
+
+    calls = []
+    release = threading.Event()
+
+    @read_only_tool
+    def lookup(term: str) -> str:
+        calls.append(term)
+        release.wait(timeout=5)
+        return term.upper()
+
+    tool = dedupe_tool_calls(lookup)
+    with tool_call_scope(), ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, tool, "bees")
+            for _ in range(4)
+        ]
+        release.set()
+        assert [future.result() for future in futures] == ["BEES"] * 4
+    assert calls == ["bees"]
+
+
+@pytest.mark.asyncio
+async def test_run_many_shares_tool_results():
+    """
+    Test that runs in one run_many batch share tool results.
+    """
+    from flock.core.cache.tool_cache import dedupe_tool_calls, read_only_tool
+
+    calls = []
+
+    @read_only_tool
+    def lookup(term: str) -> str:
+        calls.append(term)
+        return term.upper()
+
+    tool = dedupe_tool_calls(lookup)
+
+    class ToolAgent(DummyAgent):
+        async def evaluate(self, inputs: dict[str, Any]) -> dict[str, Any]:
+            return {"result": tool(inputs["term"])}
+
+    results = await ToolAgent().run_many([{"term": "bees"}] * 3 + [{"term": "ants"}])
+    assert [result["result"] for result in results] == ["BEES", "BEES", "BEES", "ANTS"]
+    assert calls == ["bees", "ants"]
+
+
+# ------------------------------------------------------------------------------
+# Test: evaluate span
+# ------------------------------------------------------------------------------
+def test_evaluate_span_reuses_current_span_by_default(monkeypatch):
+    """
+    Test that evaluate only opens its own span when detailed traces are enabled.
+    """
+    from unittest.mock import MagicMock
+
+    from flock.core import flock_agent
+    from flock.core.logging import span_payload
+
+    fake_tracer = MagicMock()
+    current_span = MagicMock()
+    monkeypatch.setattr(flock_agent, "tracer", fake_tracer)
+    monkeypatch.setattr(flock_agent.trace, "get_current_span", lambda: current_span)
+
+    agent = DummyAgent()
+    monkeypatch.setattr(span_payload, "DETAILED_TRACES", False)
+    with agent._evaluate_span() as span:
+        assert span is current_span
+    fake_tracer.start_as_current_span.assert_not_called()
+    current_span.add_event.assert_called_once_with("agent.evaluate")
+
+    monkeypatch.setattr(span_payload, "DETAILED_TRACES", True)
+    agent._evaluate_span()
+    fake_tracer.start_as_current_span.assert_called_once_with("agent.evaluate")
+
+
+def test_cache_hit_is_recorded_on_run_span(monkeypatch):
+    """
+    Test that without detailed traces, evaluate's cache_hit attribute lands on
+    the enclosing agent.run span.
+    """
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from flock.core import flock_agent
+    from flock.core.cache.result_cache import result_cache
+    from flock.core.logging import span_payload
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(flock_agent, "tracer", provider.get_tracer("test"))
+    monkeypatch.setattr(span_payload, "DETAILED_TRACES", False)
+
+    monkeypatch.setattr(FlockAgent, "_get_dspy_signature", lambda self: object)
+    monkeypatch.setattr(FlockAgent, "_configure_language_model", lambda self: None)
+    monkeypatch.setattr(
+        FlockAgent,
+        "_select_task",
+        lambda self, *args, **kwargs: lambda **inputs: _FakePrediction(result=inputs["x"]),
+    )
+
+    result_cache.clear()
+    agent = FlockAgent(name="traced_agent", input="x: int", output="result: int", cache_results=True)
+    asyncio.run(agent.run({"x": 1}))
+    asyncio.run(agent.run({"x": 1}))
+    result_cache.clear()
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["agent.run", "agent.run"]
+    assert "cache_hit" not in spans[0].attributes
+    assert spans[1].attributes["cache_hit"] is True
+    assert [event.name for event in spans[1].events] == ["agent.evaluate"]
@@ -0,0 +1,44 @@
+# test_span_payload.py
+
+from unittest.mock import MagicMock
+
+from flock.core.logging import span_payload
+from flock.core.logging.span_payload import format_payload, set_payload_attribute
+
+
+# ------------------------------------------------------------------------------
+# Tests for payload formatting
+# ------------------------------------------------------------------------------
+def test_format_payload_is_bounded():
+    """
+    Test that large payloads are abbreviated to at most MAX_PAYLOAD_LENGTH characters.
+    """
+    payload = {"text": "x" * 100_000, "items": list(range(100_000))}
+    formatted = format_payload(payload)
+    assert len(formatted) <= span_payload.MAX_PAYLOAD_LENGTH
+    assert formatted.startswith("{'items': [0, 1, 2")
+
+
+def test_set_payload_attribute_skips_non_recording_spans():
+    """
+    Test that nothing is formatted or attached when the span is not recording.
+    """
+    span = MagicMock()
+    span.is_recording.return_value = False
+    set_payload_attribute(span, "inputs", {"query": "bees"})
+    span.set_attribute.assert_not_called()
+
+    span.is_recording.return_value = True
+    set_payload_attribute(span, "inputs", {"query": "bees"})
+    span.set_attribute.assert_called_once_with("inputs", "{'query': 'bees'}")
+
+
+def test_set_payload_attribute_respects_flag(monkeypatch):
+    """
+    Test that payload tracing can be switched off.
+    """
+    monkeypatch.setattr(span_payload, "TRACE_PAYLOADS", False)
+    span = MagicMock()
+    span.is_recording.return_value = True
+    set_payload_attribute(span, "result", {"answer": 42})
+    span.set_attribute.assert_not_called()